@@ -1,20 +1,24 @@
 """A module containing continent endpoints."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from dependency_injector.wiring import inject, Provide
-from fastapi import APIRouter, Depends, HTTPException
-from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from jose import jwt
-
-from src.infrastructure.utils import consts
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from fastapi_cache.decorator import cache
+
+from src.api.utils.auth import current_user_id
+from src.cache import (
+    AIRPORT_NAMESPACE,
+    RawJSONCoder,
+    clear_airport_cache,
+    endpoint_key_builder,
+)
 from src.container import Container
 from src.core.domain.airport import Airport, AirportIn, AirportBroker
 from src.infrastructure.dto.airportdto import AirportDTO
 from src.infrastructure.services.iairport import IAirportService
 
-bearer_scheme = HTTPBearer()
-
 router = APIRouter()
 
 
@@ -23,61 +27,113 @@ router = APIRouter()
 async def create_airport(
     airport: AirportIn,
     service: IAirportService = Depends(Provide[Container.airport_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_uuid: str = Depends(current_user_id),
 ) -> dict:
     """An endpoint for adding new airport.
 
     Args:
         airport (AirportIn): The airport data.
         service (IAirportService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        user_uuid (str, optional): The id of the authenticated user.
 
     Returns:
         dict: The new airport attributes.
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
-    )
-    user_uuid = token_payload.get("sub")
-
-    if not user_uuid:
-        raise HTTPException(status_code=403, detail="Unauthorized")
-
     extended_airport_data = AirportBroker(
         user_id=user_uuid,
         **airport.model_dump(),
     )
     new_airport = await service.add_airport(extended_airport_data)
+    await clear_airport_cache()
 
     return new_airport.model_dump() if new_airport else {}
 
 
+@router.post("/bulk", response_model=Iterable[Airport], status_code=201)
+@inject
+async def create_airports(
+    airports: list[AirportIn],
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+    user_uuid: str = Depends(current_user_id),
+) -> Iterable:
+    """An endpoint for adding many airports at once.
+
+    Args:
+        airports (list[AirportIn]): The airports data.
+        service (IAirportService, optional): The injected service dependency.
+        user_uuid (str, optional): The id of the authenticated user.
+
+    Returns:
+        Iterable: The new airports attributes.
+    """
+
+    new_airports = await service.add_airports([
+        AirportBroker(user_id=user_uuid, **airport.model_dump())
+        for airport in airports
+    ])
+    await clear_airport_cache()
+
+    return new_airports
+
+
 @router.get("/all", response_model=Iterable[AirportDTO], status_code=200)
+@cache(
+    expire=60,
+    namespace=AIRPORT_NAMESPACE,
+    key_builder=endpoint_key_builder,
+    coder=RawJSONCoder,
+)
 @inject
 async def get_all_airports(
+    has_icao: bool = False,
     service: IAirportService = Depends(Provide[Container.airport_service]),
-) -> Iterable:
+) -> Response:
     """An endpoint for getting all airports.
 
     Args:
+        has_icao (bool, optional): Whether to skip airports without
+            an ICAO code. Defaults to False.
         service (IAirportService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The airport attributes collection.
+        Response: The airport attributes collection serialized by the DB.
     """
 
-    airports = await service.get_all()
+    airports = await service.get_all_json(has_icao)
 
-    return airports
+    return Response(content=airports, media_type="application/json")
+
+
+@router.get(
+        "/stream",
+        response_class=StreamingResponse,
+        status_code=200,
+)
+@inject
+async def stream_all_airports(
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> StreamingResponse:
+    """An endpoint for streaming all airports as newline-delimited JSON.
+
+    Args:
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        StreamingResponse: The airport attributes, one JSON object per line.
+    """
+
+    async def lines() -> AsyncIterator[str]:
+        """Function terminating every airport JSON with a newline."""
+        async for airport in service.stream_all_json():
+            yield airport + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
 
 
 @router.get(
         "/country/{country_id}",
-        response_model=Iterable[Airport],
+        response_model=Iterable[AirportDTO],
         status_code=200,
 )
 @inject
@@ -102,9 +158,14 @@ async def get_airports_by_country(
 
 @router.get(
         "/continent/{continent_id}",
-        response_model=Iterable[Airport],
+        response_model=Iterable[AirportDTO],
         status_code=200,
 )
+@cache(
+    expire=60,
+    namespace=AIRPORT_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_airports_by_continent(
     continent_id: int,
@@ -125,6 +186,39 @@ async def get_airports_by_continent(
     return airports
 
 
+@router.get(
+        "/location",
+        response_model=Iterable[AirportDTO],
+        status_code=200,
+)
+@inject
+async def get_airports_by_location(
+    latitude: float = Query(ge=-90, le=90),
+    longitude: float = Query(ge=-180, le=180),
+    radius: float = Query(gt=0, le=20015),
+    service: IAirportService = Depends(Provide[Container.airport_service]),
+) -> Iterable:
+    """An endpoint for getting airports by location.
+
+    Args:
+        latitude (float): The latitude of search center point.
+        longitude (float): The longitude of search center point.
+        radius (float): The radius of search in kilometres.
+        service (IAirportService, optional): The injected service dependency.
+
+    Returns:
+        Iterable: The airport details collection.
+    """
+
+    airports = await service.get_by_location(
+        latitude=latitude,
+        longitude=longitude,
+        radius=radius,
+    )
+
+    return airports
+
+
 @router.get(
         "/{airport_id}",
         response_model=AirportDTO,
@@ -156,6 +250,11 @@ async def get_airport_by_id(
         response_model=AirportDTO,
         status_code=200,
 )
+@cache(
+    expire=60,
+    namespace=AIRPORT_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_airport_by_icao(
     icao_code: str,
@@ -182,6 +281,11 @@ async def get_airport_by_icao(
         response_model=AirportDTO,
         status_code=200,
 )
+@cache(
+    expire=60,
+    namespace=AIRPORT_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_airport_by_iata(
     iata_code: str,
@@ -231,46 +335,13 @@ async def get_airports_by_user(
     return airports
 
 
-@router.get(
-        "/location",
-        response_model=Iterable[Airport],
-        status_code=200,
-)
-@inject
-async def get_airports_by_location(
-    latitude: float,
-    longitude: float,
-    radius: float,
-    service: IAirportService = Depends(Provide[Container.airport_service]),
-) -> Iterable:
-    """An endpoint for getting airports by location.
-
-    Args:
-        latitude (float): The latitude of search center point.
-        longitude (float): The longitude of search center point.
-        radius (float): The radius of search.
-        service (IAirportService, optional): The injected service dependency.
-
-    Returns:
-        Iterable: The airport details collection.
-    """
-
-    airports = await service.get_by_location(
-        latitude=latitude,
-        longitude=longitude,
-        radius=radius,
-    )
-
-    return airports
-
-
 @router.put("/{airport_id}", response_model=Airport, status_code=201)
 @inject
 async def update_airport(
     airport_id: int,
     updated_airport: AirportIn,
     service: IAirportService = Depends(Provide[Container.airport_service]),
-    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+    user_uuid: str = Depends(current_user_id),
 ) -> dict:
     """An endpoint for updating airport data.
 
@@ -278,41 +349,30 @@ async def update_airport(
         airport_id (int): The id of the airport.
         updated_airport (AirportIn): The updated airport details.
         service (IAirporttService, optional): The injected service dependency.
-        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+        user_uuid (str, optional): The id of the authenticated user.
 
     Raises:
+        HTTPException: 403 if airport was added by another user.
         HTTPException: 404 if airport does not exist.
 
     Returns:
         dict: The updated airport details.
     """
 
-    token = credentials.credentials
-    token_payload = jwt.decode(
-        token,
-        key=consts.SECRET_KEY,
-        algorithms=[consts.ALGORITHM],
+    extended_updated_airport = AirportBroker(
+        user_id=user_uuid,
+        **updated_airport.model_dump(),
     )
-    user_uuid = token_payload.get("sub")
+    if updated_airport_data := await service.update_airport(
+        airport_id=airport_id,
+        data=extended_updated_airport,
+    ):
+        await clear_airport_cache()
+        return updated_airport_data.model_dump()
 
-    if not user_uuid:
+    if await service.get_by_id(airport_id=airport_id):
         raise HTTPException(status_code=403, detail="Unauthorized")
 
-    if airport_data := await service.get_by_id(airport_id=airport_id):
-        if str(airport_data.user_id) != user_uuid:
-            raise HTTPException(status_code=403, detail="Unauthorized")
-
-        extended_updated_airport = AirportBroker(
-            user_id=user_uuid,
-            **updated_airport.model_dump(),
-        )
-        updated_airport_data = await service.update_airport(
-            airport_id=airport_id,
-            data=extended_updated_airport,
-        )
-        return updated_airport_data.model_dump() if updated_airport_data \
-            else {}
-
     raise HTTPException(status_code=404, detail="Airport not found")
 
 
@@ -332,9 +392,8 @@ async def delete_airport(
         HTTPException: 404 if airport does not exist.
     """
 
-    if await service.get_by_id(airport_id=airport_id):
-        await service.delete_airport(airport_id)
-
+    if await service.delete_airport(airport_id):
+        await clear_airport_cache()
         return
 
     raise HTTPException(status_code=404, detail="Airport not found")
@@ -3,7 +3,14 @@
 from typing import Iterable
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
-
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
+
+from src.cache import (
+    LOCATION_NAMESPACE,
+    clear_location_cache,
+    endpoint_key_builder,
+)
 from src.container import Container
 from src.core.domain.location import Continent, ContinentIn
 from src.infrastructure.services.icontinent import IContinentService
@@ -16,47 +23,95 @@ router = APIRouter()
 async def create_continent(
     continent: ContinentIn,
     service: IContinentService = Depends(Provide[Container.continent_service]),
-) -> dict:
+) -> Continent:
     """An endpoint for adding new continent.
 
     Args:
         continent (ContinentIn): The continent data.
         service (IContinentService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if continent was not created.
+
+    Returns:
+        Continent: The new continent attributes.
+    """
+
+    if new_continent := await service.add_continent(continent):
+        await clear_location_cache()
+        return new_continent
+
+    raise HTTPException(status_code=400, detail="Continent not created")
+
+
+@router.post(
+        "/bulk",
+        response_model=Iterable[Continent],
+        status_code=201,
+)
+@inject
+async def create_continents(
+    continents: list[ContinentIn],
+    service: IContinentService = Depends(Provide[Container.continent_service]),
+) -> Iterable[Continent]:
+    """An endpoint for adding many continents at once.
+
+    Args:
+        continents (list[ContinentIn]): The continents data.
+        service (IContinentService, optional): The injected service dependency.
+
     Returns:
-        dict: The new continent attributes.
+        Iterable[Continent]: The new continents attributes.
     """
 
-    new_continent = await service.add_continent(continent)
+    new_continents = await service.add_continents(continents)
+    await clear_location_cache()
 
-    return new_continent.model_dump() if new_continent else {}
+    return new_continents
 
 
-@router.get("/all", response_model=Iterable[Continent], status_code=200)
+@router.get(
+        "/all",
+        response_model=Iterable[Continent],
+        response_class=ORJSONResponse,
+        status_code=200,
+)
+@cache(
+    expire=3600,
+    namespace=LOCATION_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_all_continents(
     service: IContinentService = Depends(Provide[Container.continent_service]),
-) -> Iterable:
+) -> ORJSONResponse:
     """An endpoint for getting all continents.
 
     Args:
         service (IContinentService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The continent attributes collection.
+        ORJSONResponse: The continent attributes collection.
     """
 
     continents = await service.get_all_continents()
 
-    return continents
+    return ORJSONResponse(
+        [continent.model_dump() for continent in continents],
+    )
 
 
 @router.get("/{continent_id}", response_model=Continent, status_code=200)
+@cache(
+    expire=3600,
+    namespace=LOCATION_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_continent_by_id(
     continent_id: int,
     service: IContinentService = Depends(Provide[Container.continent_service]),
-) -> dict:
+) -> Continent:
     """An endpoint for getting continent details by id.
 
     Args:
@@ -67,11 +122,11 @@ async def get_continent_by_id(
         HTTPException: 404 if continent does not exist.
 
     Returns:
-        dict: The requested continent attributes.
+        Continent: The requested continent attributes.
     """
 
     if continent := await service.get_continent_by_id(continent_id):
-        return continent.model_dump()
+        return continent
 
     raise HTTPException(status_code=404, detail="Continent not found")
 
@@ -82,7 +137,7 @@ async def update_continent(
     continent_id: int,
     updated_continent: ContinentIn,
     service: IContinentService = Depends(Provide[Container.continent_service]),
-) -> dict:
+) -> Continent:
     """An endpoint for updating continent data.
 
     Args:
@@ -94,16 +149,15 @@ async def update_continent(
         HTTPException: 404 if continent does not exist.
 
     Returns:
-        dict: The updated continent details.
+        Continent: The updated continent details.
     """
 
-    if await service.get_continent_by_id(continent_id=continent_id):
-        new_updated_continent = await service.update_continent(
-            continent_id=continent_id,
-            data=updated_continent,
-        )
-        return new_updated_continent.model_dump() if new_updated_continent \
-            else {}
+    if new_updated_continent := await service.update_continent(
+        continent_id=continent_id,
+        data=updated_continent,
+    ):
+        await clear_location_cache()
+        return new_updated_continent
 
     raise HTTPException(status_code=404, detail="Continent not found")
 
@@ -127,8 +181,8 @@ async def delete_continent(
         dict: Empty if operation finished.
     """
 
-    if await service.get_continent_by_id(continent_id=continent_id):
-        await service.delete_continent(continent_id)
+    if await service.delete_continent(continent_id):
+        await clear_location_cache()
         return
 
     raise HTTPException(status_code=404, detail="Continent not found")
@@ -4,7 +4,14 @@ from typing import Iterable
 
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
+from fastapi_cache.decorator import cache
 
+from src.cache import (
+    LOCATION_NAMESPACE,
+    clear_location_cache,
+    endpoint_key_builder,
+)
 from src.container import Container
 from src.core.domain.location import Country, CountryIn
 from src.infrastructure.services.icountry import ICountryService
@@ -17,47 +24,95 @@ router = APIRouter()
 async def create_country(
     country: CountryIn,
     service: ICountryService = Depends(Provide[Container.country_service]),
-) -> dict:
+) -> Country:
     """An endpoint for adding new countries.
 
     Args:
         country (CountryIn): The country data.
         service (ICountryService, optional): The injected service dependency.
 
+    Raises:
+        HTTPException: 400 if country was not created.
+
     Returns:
-        dict: The new country attributes.
+        Country: The new country attributes.
     """
 
-    new_country = await service.add_country(country)
+    if new_country := await service.add_country(country):
+        await clear_location_cache()
+        return new_country
 
-    return new_country.model_dump() if new_country else {}
+    raise HTTPException(status_code=400, detail="Country not created")
 
 
-@router.get("/all", response_model=Iterable[Country], status_code=200)
+@router.post(
+        "/bulk",
+        response_model=Iterable[Country],
+        status_code=201,
+)
+@inject
+async def create_countries(
+    countries: list[CountryIn],
+    service: ICountryService = Depends(Provide[Container.country_service]),
+) -> Iterable[Country]:
+    """An endpoint for adding many countries at once.
+
+    Args:
+        countries (list[CountryIn]): The countries data.
+        service (ICountryService, optional): The injected service dependency.
+
+    Returns:
+        Iterable[Country]: The new countries attributes.
+    """
+
+    new_countries = await service.add_countries(countries)
+    await clear_location_cache()
+
+    return new_countries
+
+
+@router.get(
+        "/all",
+        response_model=Iterable[Country],
+        response_class=ORJSONResponse,
+        status_code=200,
+)
+@cache(
+    expire=3600,
+    namespace=LOCATION_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_all_countries(
     service: ICountryService = Depends(Provide[Container.country_service]),
-) -> Iterable:
+) -> ORJSONResponse:
     """An endpoint for getting all countries.
 
     Args:
         service (ICountryService, optional): The injected service dependency.
 
     Returns:
-        Iterable: The country attributes collection.
+        ORJSONResponse: The country attributes collection.
     """
 
     countries = await service.get_all_countries()
 
-    return countries
+    return ORJSONResponse(
+        [country.model_dump() for country in countries],
+    )
 
 
 @router.get("/{country_id}", response_model=Country, status_code=200)
+@cache(
+    expire=3600,
+    namespace=LOCATION_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_country_by_id(
     country_id: int,
     service: ICountryService = Depends(Provide[Container.country_service]),
-) -> dict:
+) -> Country:
     """An endpoint for getting country details by id.
 
     Args:
@@ -68,11 +123,11 @@ async def get_country_by_id(
         HTTPException: 404 if country does not exist.
 
     Returns:
-        dict: The requested country attributes.
+        Country: The requested country attributes.
     """
 
     if country := await service.get_country_by_id(country_id=country_id):
-        return country.model_dump()
+        return country
 
     raise HTTPException(status_code=404, detail="Country not found")
 
@@ -80,13 +135,19 @@ async def get_country_by_id(
 @router.get(
         "/continent/{continent_id}",
         response_model=list[Country],
+        response_class=ORJSONResponse,
         status_code=200,
 )
+@cache(
+    expire=3600,
+    namespace=LOCATION_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
 @inject
 async def get_country_by_continent(
     continent_id: int,
     service: ICountryService = Depends(Provide[Container.country_service]),
-) -> Iterable:
+) -> ORJSONResponse:
     """An endpoint for getting countries by continent.
 
     Args:
@@ -94,12 +155,14 @@ async def get_country_by_continent(
         service (ICountryService, optional): The injected service dependency.
 
     Returns:
-        dict: The requested countries.
+        ORJSONResponse: The requested countries.
     """
 
     countries = await service.get_countries_by_continent(continent_id)
 
-    return countries
+    return ORJSONResponse(
+        [country.model_dump() for country in countries],
+    )
 
 
 @router.put("/{country_id}", response_model=Country, status_code=201)
@@ -108,7 +171,7 @@ async def update_country(
     country_id: int,
     updated_country: CountryIn,
     service: ICountryService = Depends(Provide[Container.country_service]),
-) -> dict:
+) -> Country:
     """An endpoint for updating country data.
 
     Args:
@@ -120,15 +183,15 @@ async def update_country(
         HTTPException: 404 if country does not exist.
 
     Returns:
-        dict: The updated country data.
+        Country: The updated country data.
     """
 
-    if await service.get_country_by_id(country_id=country_id):
-        new_updated_country = await service.update_country(
-            country_id=country_id,
-            data=updated_country,
-        )
-        return new_updated_country.model_dump() if new_updated_country else {}
+    if new_updated_country := await service.update_country(
+        country_id=country_id,
+        data=updated_country,
+    ):
+        await clear_location_cache()
+        return new_updated_country
 
     raise HTTPException(status_code=404, detail="Country not found")
 
@@ -149,9 +212,8 @@ async def delete_country(
         HTTPException: 404 if country does not exist.
     """
 
-    if await service.get_country_by_id(country_id=country_id):
-        await service.delete_country(country_id)
-
+    if await service.delete_country(country_id):
+        await clear_location_cache()
         return
 
     raise HTTPException(status_code=404, detail="Country not found")
@@ -1,61 +1,142 @@
 """A module containing implementation of meteo API router."""
 
-from datetime import datetime
-from typing import Iterable, Optional
+import re
+from datetime import datetime, timezone
+from typing import AsyncIterator, Iterable, Optional
 from dependency_injector.wiring import inject, Provide
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from fastapi_cache.decorator import cache
 
-from src.core.domain.meteo import MetarReport
+from src.cache import (
+    METEO_NAMESPACE,
+    clear_meteo_cache,
+    endpoint_key_builder,
+    stale_fallback,
+)
+from src.core.domain.meteo import MetarReport, MetarTextReportIn
 from src.container import Container
+from src.infrastructure.dto.metarbulkdto import MetarBulkDTO
 from src.infrastructure.dto.meteostats import MeteoStatsDTO
 from src.infrastructure.services.imeteo import IMeteoService
 
 router = APIRouter()
 
+ICAO_RE = re.compile(r"[A-Z][A-Z0-9]{3}")
+
 
 @router.post("/create", response_model=MetarReport, status_code=201)
 @inject
 async def create_report(
-    report: str,
+    report: MetarTextReportIn,
     service: IMeteoService = Depends(Provide[Container.meteo_service]),
 ) -> dict:
     """A router method adding a new METAR report to the DB.
 
     Args:
-        report (str): The METAR report in string form.
+        report (MetarTextReportIn): The METAR report in string form.
         service (IMeteoService, optional): A service (injected).
 
     Returns:
         dict: A METAR report details.
     """
 
-    new_report = await service.add_text_report(report)
+    new_report = await service.add_text_report(report.report)
+    await clear_meteo_cache()
 
     return new_report.model_dump()
 
 
-@router.get("/all", response_model=Iterable[MetarReport], status_code=200)
+@router.post("/bulk", response_model=MetarBulkDTO, status_code=201)
+@inject
+async def create_reports(
+    reports: list[str],
+    service: IMeteoService = Depends(Provide[Container.meteo_service]),
+) -> MetarBulkDTO:
+    """A router method adding many METAR reports to the DB at once.
+
+    Unparsable reports are skipped and their indices are returned.
+
+    Args:
+        reports (list[str]): The METAR reports in string form.
+        service (IMeteoService, optional): A service (injected).
+
+    Returns:
+        MetarBulkDTO: The METAR reports details and the rejected indices.
+    """
+
+    result = await service.add_text_reports(reports)
+    await clear_meteo_cache()
+
+    return result
+
+
+@router.get(
+        "/all",
+        response_model=Iterable[MetarReport],
+        response_class=ORJSONResponse,
+        status_code=200,
+)
+@cache(
+    expire=10,
+    namespace=METEO_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
+@stale_fallback(METEO_NAMESPACE)
 @inject
 async def get_all_reports(
     service: IMeteoService = Depends(Provide[Container.meteo_service]),
-) -> Iterable:
+) -> ORJSONResponse:
     """A method returning all METAR reports.
 
     Returns:
-        Iterable: METAR reports.
+        ORJSONResponse: METAR reports.
     """
 
-    return await service.get_all_reports()
+    reports = await service.get_all_reports()
+
+    return ORJSONResponse([report.model_dump() for report in reports])
 
 
-@router.get("/filter", response_model=Iterable[MetarReport], status_code=200)
+@router.get(
+        "/stream",
+        response_class=StreamingResponse,
+        status_code=200,
+)
+@inject
+async def stream_all_reports(
+    service: IMeteoService = Depends(Provide[Container.meteo_service]),
+) -> StreamingResponse:
+    """A router method streaming all METAR reports as newline-delimited JSON.
+
+    Args:
+        service (IMeteoService, optional): A service (injected).
+
+    Returns:
+        StreamingResponse: The METAR reports, one JSON object per line.
+    """
+
+    async def lines() -> AsyncIterator[str]:
+        """Function terminating every report JSON with a newline."""
+        async for report in service.stream_all_json():
+            yield report + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@router.get(
+        "/filter",
+        response_model=Iterable[MetarReport],
+        response_class=ORJSONResponse,
+        status_code=200,
+)
 @inject
 async def filter_reports(
     icao: Optional[str] = None,
     start: Optional[str] = None,
     end: Optional[str] = None,
     service: IMeteoService = Depends(Provide[Container.meteo_service]),
-) -> Iterable:
+) -> ORJSONResponse:
     """A router method returning filtered METAR reports.
 
     Args:
@@ -68,30 +149,30 @@ async def filter_reports(
         service (IMeteoService, optional): The injected service instance.
 
     Raises:
-        HTTPException: Bad request if ICAO code is not provided.
+        HTTPException: Bad request if the filter is invalid.
 
     Returns:
-        Iterable: The filtered reports.
+        ORJSONResponse: The filtered reports.
     """
 
-    if not icao:
-        raise HTTPException(status_code=400, detail="ICAO code not provided")
-
-    start_date, end_date = None, None
+    start_date, end_date = _parse_filter(icao, start, end)
 
-    if start:
-        start_date = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
-    if end:
-        end_date = datetime.strptime(end, "%Y-%m-%d %H:%M:%S")
-
-    return await service.get_by_airport(
+    reports = await service.get_by_airport(
         icao_code=icao,
         start_date=start_date,
         end_date=end_date,
     )
 
+    return ORJSONResponse([report.model_dump() for report in reports])
+
 
 @router.get("/stats", response_model=MeteoStatsDTO, status_code=200)
+@cache(
+    expire=30,
+    namespace=METEO_NAMESPACE,
+    key_builder=endpoint_key_builder,
+)
+@stale_fallback(METEO_NAMESPACE)
 @inject
 async def get_stats(
     icao: Optional[str] = None,
@@ -111,24 +192,110 @@ async def get_stats(
         service (IMeteoService, optional): The injected service instance.
 
     Raises:
-        HTTPException: Bad request if ICAO code is not provided.
+        HTTPException: Bad request if the filter is invalid.
 
     Returns:
         MeteoStatsDTO: The statistics.
     """
 
-    if not icao:
-        raise HTTPException(status_code=400, detail="ICAO code not provided")
-
-    start_date, end_date = None, None
-
-    if start:
-        start_date = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
-    if end:
-        end_date = datetime.strptime(end, "%Y-%m-%d %H:%M:%S")
+    start_date, end_date = _parse_filter(icao, start, end)
 
     return await service.get_stats(
         icao_code=icao,
         start_date=start_date,
         end_date=end_date,
     )
+
+
+@router.delete("/{report_id}", status_code=204)
+@inject
+async def delete_report(
+    report_id: int,
+    service: IMeteoService = Depends(Provide[Container.meteo_service]),
+) -> None:
+    """A router method removing a METAR report from the DB.
+
+    Args:
+        report_id (int): The ID of the report.
+        service (IMeteoService, optional): A service (injected).
+
+    Raises:
+        HTTPException: 404 if report does not exist.
+    """
+
+    if await service.remove_report(report_id):
+        await clear_meteo_cache()
+        return
+
+    raise HTTPException(status_code=404, detail="Report not found")
+
+
+def _parse_filter(
+    icao: Optional[str],
+    start: Optional[str],
+    end: Optional[str],
+) -> tuple[Optional[datetime], Optional[datetime]]:
+    """Function validating the airport and period of a METAR query.
+
+    Malformed filters are rejected before any DB work is done. Both dates
+    are parsed as naive UTC first, so mixing values with and without a
+    UTC offset gives a 400 for a reversed period instead of a TypeError.
+
+    Args:
+        icao (Optional[str]): The ICAO airport code.
+        start (Optional[str]): The start date of the filter.
+        end (Optional[str]): The end date of the filter.
+
+    Raises:
+        HTTPException: Bad request if the filter is invalid.
+
+    Returns:
+        tuple[Optional[datetime], Optional[datetime]]: The parsed period.
+    """
+
+    if not icao:
+        raise HTTPException(status_code=400, detail="ICAO code not provided")
+    if not ICAO_RE.fullmatch(icao):
+        raise HTTPException(status_code=400, detail="Invalid ICAO code")
+
+    start_date, end_date = _parse_datetime(start), _parse_datetime(end)
+    if start_date and end_date and start_date > end_date:
+        raise HTTPException(
+            status_code=400,
+            detail="Start date is after end date",
+        )
+
+    return start_date, end_date
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    """Function parsing a `YYYY-MM-DD HH:MM:SS` query parameter.
+
+    METAR times are stored as naive UTC, so dates with a UTC offset are
+    converted to UTC and stripped of their timezone.
+
+    Args:
+        value (Optional[str]): The date and time in text form.
+
+    Raises:
+        HTTPException: Bad request if the date is malformed.
+
+    Returns:
+        Optional[datetime]: The parsed date and time if provided.
+    """
+
+    if not value:
+        return None
+
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError as exception:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid date format",
+        ) from exception
+
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+
+    return parsed
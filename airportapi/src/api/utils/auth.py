@@ -0,0 +1,41 @@
+"""A module containing authentication dependencies for endpoints."""
+
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwt
+
+from src.infrastructure.utils import consts
+
+bearer_scheme = HTTPBearer()
+
+
+async def current_user_id(
+    credentials: HTTPAuthorizationCredentials = Depends(bearer_scheme),
+) -> str:
+    """A dependency decoding the user id from the bearer token.
+
+    Args:
+        credentials (HTTPAuthorizationCredentials, optional): The credentials.
+
+    Raises:
+        HTTPException: 403 if the token is invalid or has no user id.
+
+    Returns:
+        str: The UUID of the authenticated user.
+    """
+    try:
+        token_payload = jwt.decode(
+            credentials.credentials,
+            key=consts.SECRET_KEY,
+            algorithms=[consts.ALGORITHM],
+        )
+    except JWTError as exception:
+        raise HTTPException(
+            status_code=403,
+            detail="Unauthorized",
+        ) from exception
+
+    if not (user_uuid := token_payload.get("sub")):
+        raise HTTPException(status_code=403, detail="Unauthorized")
+
+    return user_uuid
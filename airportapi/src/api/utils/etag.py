@@ -0,0 +1,105 @@
+"""A module containing the conditional GET middleware."""
+
+import hashlib
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class ETagMiddleware:
+    """An ASGI middleware tagging GET responses with weak ETags.
+
+    The ETag is a hash of the response body, so it is stable across
+    workers and restarts. It is weak, as the gzip and identity encodings
+    of a body share it. Requests with a matching `If-None-Match` get
+    a bodyless 304. Streamed responses are passed through untouched.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """The initializer of the middleware.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        """The method handling a single ASGI request.
+
+        Args:
+            scope (Scope): The connection scope.
+            receive (Receive): The incoming messages channel.
+            send (Send): The outgoing messages channel.
+        """
+
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        start: Message | None = None
+        passthrough = False
+
+        async def send_with_etag(message: Message) -> None:
+            nonlocal start, passthrough
+
+            if passthrough:
+                await send(message)
+                return
+
+            if message["type"] == "http.response.start":
+                start = message
+                return
+
+            if start is None:
+                await send(message)
+                return
+
+            if start["status"] != 200 or message.get("more_body", False):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            etag = f'W/"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+            headers = MutableHeaders(scope=start)
+            headers["ETag"] = etag
+
+            if if_none_match and _etag_matches(etag, if_none_match):
+                del headers["Content-Length"]
+                del headers["Content-Type"]
+                start["status"] = 304
+                await send(start)
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start)
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
+
+
+def _etag_matches(etag: str, if_none_match: str) -> bool:
+    """Function weakly comparing an ETag with an `If-None-Match` value.
+
+    Args:
+        etag (str): The ETag of the current response.
+        if_none_match (str): The header value sent by the client.
+
+    Returns:
+        bool: Whether the client already has the current representation.
+    """
+
+    candidates = {
+        candidate.strip().removeprefix("W/")
+        for candidate in if_none_match.split(",")
+    }
+
+    return "*" in candidates or etag.removeprefix("W/") in candidates
@@ -0,0 +1,195 @@
+"""A module providing response cache configuration."""
+
+from functools import wraps
+from typing import Any, Awaitable, Callable, Optional, Type
+
+from fastapi import Request, Response
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.backends.redis import RedisBackend
+from fastapi_cache.coder import Coder, JsonCoder
+from redis import asyncio as aioredis
+
+from src.config import config
+from src.db import CONNECTION_ERRORS
+
+CACHE_PREFIX = "airport"
+LOCATION_NAMESPACE = "location"
+AIRPORT_NAMESPACE = "airports"
+METEO_NAMESPACE = "meteo"
+STALE_NAMESPACE = "stale"
+STALE_EXPIRE = 24 * 60 * 60
+
+
+def init_cache() -> None:
+    """Function initializing the response cache backend.
+
+    Redis is used when configured, otherwise the cache is kept in memory.
+    """
+    if config.REDIS_HOST:
+        redis = aioredis.from_url(
+            f"redis://{config.REDIS_HOST}:{config.REDIS_PORT}",
+        )
+        FastAPICache.init(RedisBackend(redis), prefix=CACHE_PREFIX)
+    else:
+        FastAPICache.init(InMemoryBackend(), prefix=CACHE_PREFIX)
+
+
+class RawJSONCoder(Coder):
+    """A coder caching JSON response bodies as they are.
+
+    The bodies are neither decoded nor validated on a cache hit, so large
+    JSON arrays are served without any serialization work.
+    """
+
+    @classmethod
+    def encode(cls, value: Response) -> bytes:
+        """The method preparing the response body for the cache.
+
+        Args:
+            value (Response): The JSON response.
+
+        Returns:
+            bytes: The response body.
+        """
+
+        return bytes(value.body)
+
+    @classmethod
+    def decode(cls, value: bytes) -> Response:
+        """The method preparing a response from the cached body.
+
+        Args:
+            value (bytes): The cached response body.
+
+        Returns:
+            Response: The JSON response.
+        """
+
+        return Response(content=value, media_type="application/json")
+
+    @classmethod
+    def decode_as_type(cls, value: bytes, *, type_: Any) -> Response:
+        """The method preparing a response from the cached body.
+
+        Args:
+            value (bytes): The cached response body.
+            type_ (Any): The endpoint return type, ignored.
+
+        Returns:
+            Response: The JSON response.
+        """
+
+        return cls.decode(value)
+
+
+def endpoint_key_builder(
+    func: Callable[..., Any],
+    namespace: str = "",
+    *,
+    request: Optional[Request] = None,
+    response: Optional[Response] = None,
+    args: tuple = (),
+    kwargs: Optional[dict] = None,
+) -> str:
+    """Function building cache keys ignoring the injected service.
+
+    Args:
+        func (Callable[..., Any]): The cached endpoint.
+        namespace (str, optional): The cache namespace. Defaults to "".
+        request (Optional[Request], optional): The HTTP request.
+        response (Optional[Response], optional): The HTTP response.
+        args (tuple, optional): The positional endpoint arguments.
+        kwargs (Optional[dict], optional): The keyword endpoint arguments.
+
+    Returns:
+        str: The cache key.
+    """
+    params = sorted(
+        (name, value) for name, value in (kwargs or {}).items()
+        if name != "service"
+    )
+
+    return f"{namespace}:{func.__module__}:{func.__name__}:{args}:{params}"
+
+
+def stale_fallback(
+    namespace: str,
+    expire: int = STALE_EXPIRE,
+    coder: Type[Coder] = JsonCoder,
+) -> Callable[[Callable[..., Awaitable[Any]]], Callable[..., Awaitable[Any]]]:
+    """Function creating a decorator serving stale responses on DB errors.
+
+    Every successful response is kept as a long-lived shadow copy. The
+    copies are not removed when the namespace is invalidated, so the last
+    known response is returned while the DB is unreachable.
+
+    Args:
+        namespace (str): The cache namespace of the endpoint.
+        expire (int, optional): Lifetime of the shadow copies in seconds.
+            Defaults to STALE_EXPIRE.
+        coder (Type[Coder], optional): The coder of the responses.
+            Defaults to JsonCoder.
+
+    Returns:
+        Callable: The endpoint decorator.
+    """
+
+    def decorator(
+        func: Callable[..., Awaitable[Any]],
+    ) -> Callable[..., Awaitable[Any]]:
+        """Function wrapping the endpoint with the stale fallback."""
+
+        @wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            """Function calling the endpoint or serving its shadow copy."""
+            backend = FastAPICache.get_backend()
+            key = endpoint_key_builder(
+                func,
+                f"{FastAPICache.get_prefix()}:{STALE_NAMESPACE}:{namespace}",
+                args=args,
+                kwargs=kwargs,
+            )
+
+            try:
+                result = await func(*args, **kwargs)
+            except CONNECTION_ERRORS as e:
+                try:
+                    cached = await backend.get(key)
+                except Exception:
+                    cached = None
+                if cached is None:
+                    raise
+                print(f"Serving stale response from cache: {e!r}")
+                return coder.decode(cached)
+
+            try:
+                await backend.set(key, coder.encode(result), expire)
+            except Exception as e:
+                print(f"Stale response not cached: {e!r}")
+
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+async def clear_location_cache() -> None:
+    """Function invalidating cached continent and country responses.
+
+    Cached airports embed their country and continent, so they are
+    invalidated as well.
+    """
+    await FastAPICache.clear(namespace=LOCATION_NAMESPACE)
+    await clear_airport_cache()
+
+
+async def clear_airport_cache() -> None:
+    """Function invalidating cached airport responses."""
+    await FastAPICache.clear(namespace=AIRPORT_NAMESPACE)
+
+
+async def clear_meteo_cache() -> None:
+    """Function invalidating cached METAR report responses."""
+    await FastAPICache.clear(namespace=METEO_NAMESPACE)
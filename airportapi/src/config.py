@@ -15,6 +15,16 @@ class AppConfig(BaseConfig):
     DB_NAME: Optional[str] = None
     DB_USER: Optional[str] = None
     DB_PASSWORD: Optional[str] = None
+    DB_FORCE_ROLLBACK: bool = False
+    DB_POOL_MIN_SIZE: int = 10
+    DB_POOL_MAX_SIZE: int = 30
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_COMMAND_TIMEOUT: float = 60.0
+    DB_MAX_INACTIVE_LIFETIME: float = 300.0
+    DB_TCP_KEEPALIVES_IDLE: int = 30
+    REDIS_HOST: Optional[str] = None
+    REDIS_PORT: int = 6379
+    SQL_ECHO: bool = False
 
 
 config = AppConfig()
@@ -1,7 +1,7 @@
 """Module providing containers injecting dependencies."""
 
 from dependency_injector.containers import DeclarativeContainer
-from dependency_injector.providers import Factory, Singleton
+from dependency_injector.providers import Singleton
 
 from src.infrastructure.repositories.user import UserRepository
 from src.infrastructure.repositories.airportdb import \
@@ -26,23 +26,23 @@ class Container(DeclarativeContainer):
     meteo_repository = Singleton(MeteoRepository)
     user_repository = Singleton(UserRepository)
 
-    continent_service = Factory(
+    continent_service = Singleton(
         ContinentService,
         repository=continent_repository,
     )
-    country_service = Factory(
+    country_service = Singleton(
         CountryService,
         repository=country_repository,
     )
-    airport_service = Factory(
+    airport_service = Singleton(
         AirportService,
         repository=airport_repository,
     )
-    meteo_service = Factory(
+    meteo_service = Singleton(
         MeteoService,
         repository=meteo_repository,
     )
-    user_service = Factory(
+    user_service = Singleton(
         UserService,
         repository=user_repository,
     )
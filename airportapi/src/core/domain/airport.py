@@ -2,7 +2,7 @@
 
 from typing import Optional
 
-from pydantic import UUID4, BaseModel, ConfigDict
+from pydantic import UUID4, BaseModel, ConfigDict, Field
 
 
 class AirportIn(BaseModel):
@@ -11,9 +11,9 @@ class AirportIn(BaseModel):
     icao_code: str
     iata_code: str
     country_id: int
-    latitude: str
-    longitude: str
-    elevation: int
+    latitude: float
+    longitude: float
+    elevation: int = Field(ge=-1000, le=30000)
     vor_freq: Optional[str] = None
     dme_freq: Optional[str] = None
     ils_loc_freq: Optional[str] = None
@@ -1,11 +1,26 @@
 """Module containing metar report model."""
 
-from datetime import datetime
+import re
+from datetime import datetime, timezone
 from typing import Optional, Self
 
 from metar import Metar
 from pydantic import BaseModel, ConfigDict
 
+METAR_RE = re.compile(
+    r"(?P<station>[A-Z]{4}) "
+    r"(?P<day>\d\d)(?P<hour>\d\d)(?P<min>\d\d)Z "
+    r"(?:AUTO )?"
+    r"(?P<dir>\d{3}|VRB)(?P<speed>\d{2,3})(?:G(?P<gust>\d{2,3}))?"
+    r"(?:KT|MPS) "
+    r"(?:(?P<varfrom>\d{3})V(?P<varto>\d{3}) )?"
+    r"(?P<vis>\d{4}) "
+    r"(?P<sky>(?:(?:FEW|SCT|BKN|OVC)\d{3} )*)"
+    r"(?P<temp>M?\d\d)/(?P<dewpt>M?\d\d) "
+    r"Q(?P<press>\d{4})"
+)
+SKY_LAYER_RE = re.compile(r"(?P<cover>[A-Z]{3})(?P<height>\d{3}) ")
+
 
 class MetarReportIn(BaseModel):
     """A model representing input METAR report."""
@@ -37,6 +52,9 @@ class MetarReportIn(BaseModel):
         Returns:
             Self: Parsed METAR report.
         """
+        if match := METAR_RE.fullmatch(report):
+            return cls._from_match(match)
+
         obs = Metar.Metar(report)
 
         return cls(
@@ -58,9 +76,91 @@ class MetarReportIn(BaseModel):
             qnh=obs.press.value() if obs.press else None,
         )
 
+    @classmethod
+    def _from_match(cls, match: re.Match) -> Self:
+        """A method preparing METAR object from a common-form report.
+
+        The values are the same as parsed by `Metar.Metar`, so both paths
+        store identical reports.
+
+        Args:
+            match (re.Match): The `METAR_RE` match of the report.
+
+        Returns:
+            Self: Parsed METAR report.
+        """
+        group = match.group
+        visibility = group("vis")
+
+        return cls.model_construct(
+            icao_code=group("station"),
+            date_time=_observation_time(
+                day=int(group("day")),
+                hour=int(group("hour")),
+                minute=int(group("min")),
+            ),
+            wind_speed=float(group("speed")),
+            wind_direction=(
+                float(group("dir")) if group("dir") != "VRB" else None
+            ),
+            wind_var_from=(
+                float(group("varfrom")) if group("varfrom") else None
+            ),
+            wind_var_to=float(group("varto")) if group("varto") else None,
+            wind_gust=float(group("gust")) if group("gust") else None,
+            rvr=10000.0 if visibility == "9999" else float(visibility),
+            rvr_direction=None,
+            dew_point=_temperature(group("dewpt")),
+            sky=[
+                (layer["cover"], float(int(layer["height"]) * 100))
+                for layer in SKY_LAYER_RE.finditer(group("sky"))
+            ],
+            temp=_temperature(group("temp")),
+            qnh=float(group("press")),
+        )
+
+
+def _observation_time(day: int, hour: int, minute: int) -> datetime:
+    """Function dating a METAR observation like `Metar.Metar` does.
+
+    The report carries only the day of month, so the current UTC month
+    is assumed, or the previous one if the day is still ahead.
+
+    Args:
+        day (int): The day of month.
+        hour (int): The hour.
+        minute (int): The minute.
+
+    Returns:
+        datetime: The observation time.
+    """
+    now = datetime.now(timezone.utc)
+    year, month = now.year, now.month
+    if day > now.day:
+        year, month = (year - 1, 12) if month == 1 else (year, month - 1)
+
+    return datetime(year, month, day, hour, minute)
+
+
+def _temperature(value: str) -> float:
+    """Function converting a METAR temperature with `M` for minus.
+
+    Args:
+        value (str): The temperature group.
+
+    Returns:
+        float: The temperature in degrees Celsius.
+    """
+    return -float(value[1:]) if value.startswith("M") else float(value)
+
 
 class MetarReport(MetarReportIn):
     """A model representing full metar report"""
     id: int
 
     model_config = ConfigDict(from_attributes=True, extra="ignore")
+
+
+class MetarTextReportIn(BaseModel):
+    """A model representing input metar report in text form"""
+    report: str
@@ -1,7 +1,7 @@
 """Module containing airport repository abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Iterable
+from typing import Any, AsyncIterator, Iterable
 
 from src.core.domain.airport import AirportBroker
 
@@ -17,6 +17,26 @@ class IAirportRepository(ABC):
             Iterable[Any]: Airports in the data storage.
         """
 
+    @abstractmethod
+    async def get_all_airports_json(self, has_icao: bool = False) -> str:
+        """The abstract getting all airports serialized to JSON.
+
+        Args:
+            has_icao (bool, optional): Whether to skip airports without
+                an ICAO code. Defaults to False.
+
+        Returns:
+            str: The JSON array of airports in the data storage.
+        """
+
+    @abstractmethod
+    def iterate_all_airports_json(self) -> AsyncIterator[str]:
+        """The abstract iterating over all airports serialized to JSON.
+
+        Yields:
+            str: The JSON object of the next airport.
+        """
+
     @abstractmethod
     async def get_by_country(self, country_id: int) -> Iterable[Any]:
         """The abstract getting airports assigned to particular country.
@@ -95,7 +115,7 @@ class IAirportRepository(ABC):
         Args:
             latitude (float): The geographical latitude.
             longitude (float): The geographical longitude.
-            radius (float): The radius airports to search.
+            radius (float): The radius airports to search in kilometres.
 
         Returns:
             Iterable[Any]: The result airport collection.
@@ -112,6 +132,20 @@ class IAirportRepository(ABC):
             Any | None: The newly added airport.
         """
 
+    @abstractmethod
+    async def add_airports(
+        self,
+        data: Iterable[AirportBroker],
+    ) -> Iterable[Any]:
+        """The abstract adding many airports to the data storage at once.
+
+        Args:
+            data (Iterable[AirportBroker]): The details of the airports.
+
+        Returns:
+            Iterable[Any]: The newly created airports.
+        """
+
     @abstractmethod
     async def update_airport(
         self,
@@ -120,6 +154,8 @@ class IAirportRepository(ABC):
     ) -> Any | None:
         """The abstract updating airport data in the data storage.
 
+        Only the airport added by the user from the details is updated.
+
         Args:
             airport_id (int): The id of the airport.
             data (AirportBroker): The details of the updated airport.
@@ -39,6 +39,20 @@ class IContinentRepository(ABC):
             Any | None: The newly created continent.
         """
 
+    @abstractmethod
+    async def add_continents(
+        self,
+        data: Iterable[ContinentIn],
+    ) -> Iterable[Any]:
+        """The abstract adding many continents to the data storage at once.
+
+        Args:
+            data (Iterable[ContinentIn]): The attributes of the continents.
+
+        Returns:
+            Iterable[Any]: The newly created continents.
+        """
+
     @abstractmethod
     async def update_continent(
         self,
@@ -52,7 +66,7 @@ class IContinentRepository(ABC):
             data (ContinentIn): The attributes of the continent.
 
         Returns:
-            Any | None: The updated continent.
+            Any | None: The updated continent if exists.
         """
 
     @abstractmethod
@@ -54,6 +54,17 @@ class ICountryRepository(ABC):
             Any | None: The newly created country.
         """
 
+    @abstractmethod
+    async def add_countries(self, data: Iterable[CountryIn]) -> Iterable[Any]:
+        """The abstract adding many countries to the data storage at once.
+
+        Args:
+            data (Iterable[CountryIn]): The attributes of the countries.
+
+        Returns:
+            Iterable[Any]: The newly created countries.
+        """
+
     @abstractmethod
     async def update_country(
         self,
@@ -67,7 +78,7 @@ class ICountryRepository(ABC):
             data (CountryIn): The attributes of the country.
 
         Returns:
-            Any | None: The updated country.
+            Any | None: The updated country if exists.
         """
 
     @abstractmethod
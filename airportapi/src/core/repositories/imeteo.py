@@ -3,7 +3,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Iterable, Optional
+from typing import Any, AsyncIterator, Iterable, Optional
 
 from src.core.domain.meteo import MetarReportIn
 
@@ -19,6 +19,14 @@ class IMeteoRepository(ABC):
             Iterable[Any]: The all meteo reports.
         """
 
+    @abstractmethod
+    def iterate_all_reports_json(self) -> AsyncIterator[str]:
+        """A method iterating over all reports serialized to JSON.
+
+        Yields:
+            str: The JSON object of the next report.
+        """
+
     @abstractmethod
     async def get_by_airport(
         self,
@@ -39,6 +47,27 @@ class IMeteoRepository(ABC):
             Iterable[Any]: The filtered Metar reports.
         """
 
+    @abstractmethod
+    async def get_stats(
+        self,
+        icao_code: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Any:
+        """A method aggregating reports from provided airport in the DB.
+
+        Args:
+            icao_code (str): The ICAO code of the airport.
+            start_date (Optional[datetime], optional): Start datetime.
+                Defaults to None.
+            end_date (Optional[datetime], optional): End datetime.
+                Defaults to None.
+
+        Returns:
+            Any: The averages, minimums and maximums of the measurements
+                with the times of the first and the last report.
+        """
+
     @abstractmethod
     async def get_by_id(self, report_id: int) -> Any | None:
         """A method returning report details by its ID.
@@ -61,6 +90,17 @@ class IMeteoRepository(ABC):
             Any: The Metar report.
         """
 
+    @abstractmethod
+    async def add_reports(self, reports: Iterable[MetarReportIn]) -> Any:
+        """A method adding many METAR reports to the DB at once.
+
+        Args:
+            reports (Iterable[MetarReportIn]): The input METAR reports.
+
+        Returns:
+            Any: The Metar reports.
+        """
+
     @abstractmethod
     async def add_text_report(self, text_report: str) -> Any:
         """A method adding new text METAR report to the DB.
@@ -73,9 +113,12 @@ class IMeteoRepository(ABC):
         """
 
     @abstractmethod
-    async def remove_report(self, report_id: int) -> None:
+    async def remove_report(self, report_id: int) -> bool:
         """A method removing METAR report from DB.
 
         Args:
             report_id (int): The ID of the report.
+
+        Returns:
+            bool: Success of the operation.
         """
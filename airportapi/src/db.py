@@ -1,13 +1,19 @@
 """A module providing database access."""
 
 import asyncio
+import logging
+import pickle
+import random
+from typing import Any, AsyncIterator, Mapping, NamedTuple
 
 import databases
 import sqlalchemy
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.exc import OperationalError, DatabaseError
-from sqlalchemy.ext.asyncio import create_async_engine
-from sqlalchemy.ext.mutable import MutableList
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.dialects.postgresql.asyncpg import PGDialect_asyncpg
+from sqlalchemy.exc import OperationalError, DatabaseError, IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, create_async_engine
+from sqlalchemy.schema import CreateIndex
+from asyncpg import Record  # type: ignore
 from asyncpg.exceptions import (    # type: ignore
     CannotConnectNowError,
     ConnectionDoesNotExistError,
@@ -15,6 +21,18 @@ from asyncpg.exceptions import (    # type: ignore
 
 from src.config import config
 
+logger = logging.getLogger(__name__)
+
+SKY_BATCH_SIZE = 1000
+
+CONNECTION_ERRORS = (
+    OperationalError,
+    CannotConnectNowError,
+    ConnectionDoesNotExistError,
+    OSError,
+    asyncio.TimeoutError,
+)
+
 metadata = sqlalchemy.MetaData()
 
 continent_table = sqlalchemy.Table(
@@ -36,6 +54,7 @@ country_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("continents.id"),
         nullable=False,
     ),
+    sqlalchemy.Index("ix_countries_continent_id", "continent_id"),
 )
 
 airport_table = sqlalchemy.Table(
@@ -50,9 +69,9 @@ airport_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("countries.id"),
         nullable=False,
     ),
-    sqlalchemy.Column("latitude", sqlalchemy.String),
-    sqlalchemy.Column("longitude", sqlalchemy.String),
-    sqlalchemy.Column("elevation", sqlalchemy.Integer),
+    sqlalchemy.Column("latitude", sqlalchemy.Float),
+    sqlalchemy.Column("longitude", sqlalchemy.Float),
+    sqlalchemy.Column("elevation", sqlalchemy.SmallInteger),
     sqlalchemy.Column("vor_freq", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("dme_freq", sqlalchemy.String, nullable=True),
     sqlalchemy.Column("ils_loc_freq", sqlalchemy.String, nullable=True),
@@ -62,6 +81,16 @@ airport_table = sqlalchemy.Table(
         sqlalchemy.ForeignKey("users.id"),
         nullable=False,
     ),
+    # Airports without an ICAO code store an empty one, which may repeat.
+    sqlalchemy.Index(
+        "ix_airports_icao_code",
+        "icao_code",
+        unique=True,
+        postgresql_where=sqlalchemy.text("icao_code <> ''"),
+    ),
+    sqlalchemy.Index("ix_airports_iata_code", "iata_code"),
+    sqlalchemy.Index("ix_airports_country_id", "country_id"),
+    sqlalchemy.Index("ix_airports_location", "latitude", "longitude"),
 )
 
 metar_table = sqlalchemy.Table(
@@ -78,14 +107,11 @@ metar_table = sqlalchemy.Table(
     sqlalchemy.Column("rvr", sqlalchemy.Float, nullable=True),
     sqlalchemy.Column("rvr_direction", sqlalchemy.Float, nullable=True),
     sqlalchemy.Column("dew_point", sqlalchemy.Float, nullable=True),
-    sqlalchemy.Column(
-        "sky",
-        MutableList.as_mutable(sqlalchemy.PickleType),  # type: ignore
-        nullable=True,
-        default=[],
-    ),
+    sqlalchemy.Column("sky", JSONB, nullable=True, default=list),
     sqlalchemy.Column("temp", sqlalchemy.Float, nullable=True),
     sqlalchemy.Column("qnh", sqlalchemy.Float, nullable=True),
+    sqlalchemy.Index("ix_metars_icao_datetime", "icao_code", "date_time"),
+    sqlalchemy.Index("ix_metars_date_time", "date_time"),
 )
 
 user_table = sqlalchemy.Table(
@@ -108,37 +134,332 @@ db_uri = (
 
 engine = create_async_engine(
     db_uri,
-    echo=True,
+    echo=config.SQL_ECHO,
     future=True,
     pool_pre_ping=True,
+    connect_args={
+        "statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": config.DB_STATEMENT_CACHE_SIZE,
+    },
 )
 
 database = databases.Database(
     db_uri,
-    force_rollback=True,
+    force_rollback=config.DB_FORCE_ROLLBACK,
+    min_size=config.DB_POOL_MIN_SIZE,
+    max_size=config.DB_POOL_MAX_SIZE,
+    statement_cache_size=config.DB_STATEMENT_CACHE_SIZE,
+    command_timeout=config.DB_COMMAND_TIMEOUT,
+    max_inactive_connection_lifetime=config.DB_MAX_INACTIVE_LIFETIME,
+    server_settings={
+        "tcp_keepalives_idle": str(config.DB_TCP_KEEPALIVES_IDLE),
+    },
 )
 
+asyncpg_dialect = PGDialect_asyncpg()
+
+
+def compile_query(query: sqlalchemy.ClauseElement) -> str:
+    """Function rendering a query into SQL native for asyncpg.
+
+    Args:
+        query (sqlalchemy.ClauseElement): The SQLAlchemy Core query.
+
+    Returns:
+        str: The SQL text with positional ($n) parameters.
+    """
+    return str(query.compile(dialect=asyncpg_dialect))
+
+
+class NamedQuery(NamedTuple):
+    """A query rendered for asyncpg along with its parameter names."""
+
+    sql: str
+    params: tuple[str, ...]
+
+    def bind(self, values: Mapping[str, Any]) -> tuple:
+        """A method ordering named values as positional query parameters.
+
+        Args:
+            values (Mapping[str, Any]): The values by parameter name.
+
+        Returns:
+            tuple: The positional query parameters.
+        """
+        return tuple(values[name] for name in self.params)
+
+
+def compile_named_query(query: sqlalchemy.ClauseElement) -> NamedQuery:
+    """Function rendering a query with named bind parameters for asyncpg.
+
+    Unlike passing `:name` SQL to `databases`, the text is compiled once,
+    so asyncpg's statement cache gets the same SQL on every call.
+
+    Args:
+        query (sqlalchemy.ClauseElement): The SQLAlchemy Core query.
+
+    Returns:
+        NamedQuery: The SQL text and the order of its parameters.
+    """
+    compiled = query.compile(dialect=asyncpg_dialect)
+
+    return NamedQuery(str(compiled), tuple(compiled.positiontup or ()))
+
+
+async def fetch_raw(query: str, *args: Any) -> list[Record]:
+    """Function fetching records directly through the asyncpg connection.
+
+    The connection is taken from the `database` pool, but the query
+    building and record wrapping done by `databases` are skipped.
+
+    Args:
+        query (str): The SQL text compiled by `compile_query`.
+        *args (Any): The positional query parameters.
+
+    Returns:
+        list[Record]: The fetched records.
+    """
+    async with database.connection() as connection:
+        return await connection.raw_connection.fetch(query, *args)
+
+
+async def fetch_raw_row(query: str, *args: Any) -> Record | None:
+    """Function fetching a single record through the asyncpg connection.
+
+    Args:
+        query (str): The SQL text compiled by `compile_query`.
+        *args (Any): The positional query parameters.
+
+    Returns:
+        Record | None: The first fetched record if exists.
+    """
+    async with database.connection() as connection:
+        return await connection.raw_connection.fetchrow(query, *args)
+
 
-async def init_db(retries: int = 5, delay: int = 5) -> None:
+async def fetch_raw_val(query: str, *args: Any) -> Any:
+    """Function fetching a single value through the asyncpg connection.
+
+    Args:
+        query (str): The SQL text compiled by `compile_query`.
+        *args (Any): The positional query parameters.
+
+    Returns:
+        Any: The first column of the first fetched record.
+    """
+    async with database.connection() as connection:
+        return await connection.raw_connection.fetchval(query, *args)
+
+
+async def iterate_raw(
+    query: str,
+    *args: Any,
+    prefetch: int = 500,
+) -> AsyncIterator[Record]:
+    """Function iterating over records with a server-side cursor.
+
+    The connection is held until the iteration ends, so the whole result
+    is never loaded into memory at once.
+
+    Args:
+        query (str): The SQL text compiled by `compile_query`.
+        *args (Any): The positional query parameters.
+        prefetch (int, optional): The number of records fetched at once.
+            Defaults to 500.
+
+    Yields:
+        Record: The next fetched record.
+    """
+    async with database.connection() as connection:
+        raw_connection = connection.raw_connection
+        async with raw_connection.transaction():
+            async for record in raw_connection.cursor(
+                query,
+                *args,
+                prefetch=prefetch,
+            ):
+                yield record
+
+
+async def init_db(
+    retries: int = 5,
+    base_delay: float = 1.0,
+    max_delay: float = 30.0,
+    timeout: float = 5.0,
+) -> None:
     """Function initializing the DB.
 
+    The engine is used only for creating the schema, so its connections
+    are released afterwards and requests are served by the `database` pool.
+    Failed connection attempts are retried with exponential backoff and
+    jitter, so restarted workers do not hit the DB in lockstep. The
+    schema upgrade itself is not time limited, as converting existing
+    rows may take long on large tables.
+
     Args:
         retries (int, optional): Number of retries of connect to DB.
             Defaults to 5.
-        delay (int, optional): Delay of connect do DB. Defaults to 2.
+        base_delay (float, optional): Delay before the first retry.
+            Defaults to 1.0.
+        max_delay (float, optional): Upper bound of the retry delay.
+            Defaults to 30.0.
+        timeout (float, optional): Time limit of a single connection
+            attempt. Defaults to 5.0.
+
+    Raises:
+        ConnectionError: If the DB cannot be reached.
+        RuntimeError: If the DB schema cannot be upgraded.
     """
     for attempt in range(retries):
         try:
-            async with engine.begin() as conn:
-                await conn.run_sync(metadata.create_all)
-            return
-        except (
-            OperationalError,
-            DatabaseError,
-            CannotConnectNowError,
-            ConnectionDoesNotExistError,
-        ) as e:
-            print(f"Attempt {attempt + 1} failed: {e}")
-            await asyncio.sleep(delay)
+            conn = await asyncio.wait_for(engine.connect(), timeout=timeout)
+        except (DatabaseError, *CONNECTION_ERRORS) as e:
+            logger.warning("Attempt %d failed: %r", attempt + 1, e)
+            if attempt + 1 < retries:
+                delay = min(max_delay, base_delay * 2 ** attempt)
+                await asyncio.sleep(delay * random.uniform(0.5, 1.5))
+            continue
+
+        try:
+            await _create_schema(conn)
+        except Exception as e:
+            raise RuntimeError("Could not migrate the DB schema.") from e
+        finally:
+            await conn.close()
+            await engine.dispose()
+        return
 
     raise ConnectionError("Could not connect to DB after several retries.")
+
+
+async def _create_schema(conn: AsyncConnection) -> None:
+    """Function creating and upgrading the DB schema in one transaction.
+
+    Args:
+        conn (AsyncConnection): The engine connection.
+    """
+    async with conn.begin():
+        await conn.run_sync(metadata.create_all)
+        await conn.run_sync(_migrate_schema)
+
+
+def _migrate_schema(connection: sqlalchemy.Connection) -> None:
+    """Function upgrading tables created by earlier versions of the app.
+
+    `create_all` neither alters existing tables nor adds indexes to them.
+    Every step checks the current schema first, so it is safe to run on
+    each startup.
+
+    Args:
+        connection (sqlalchemy.Connection): The schema connection.
+    """
+    inspector = sqlalchemy.inspect(connection)
+    airport_columns = {
+        column["name"]: column["type"]
+        for column in inspector.get_columns("airports")
+    }
+    for name in ("latitude", "longitude"):
+        if isinstance(airport_columns[name], sqlalchemy.String):
+            connection.execute(sqlalchemy.text(
+                f"ALTER TABLE airports ALTER COLUMN {name} "
+                f"TYPE double precision "
+                f"USING NULLIF(trim({name}), '')::double precision"
+            ))
+
+    metar_columns = {
+        column["name"]: column["type"]
+        for column in inspector.get_columns("metars")
+    }
+    if isinstance(metar_columns["sky"], sqlalchemy.LargeBinary):
+        _convert_sky_to_jsonb(connection)
+
+    _create_indexes(
+        connection,
+        airport_table,
+        "ix_airports_iata_code",
+        "ix_airports_country_id",
+        "ix_airports_location",
+    )
+    _create_indexes(connection, country_table, "ix_countries_continent_id")
+    _create_indexes(
+        connection,
+        metar_table,
+        "ix_metars_icao_datetime",
+        "ix_metars_date_time",
+    )
+
+    # Earlier versions made the ICAO code unique also for empty codes.
+    for index in inspector.get_indexes("airports"):
+        if index["name"] == "ix_airports_icao_code" \
+                and "postgresql_where" not in index["dialect_options"]:
+            connection.execute(sqlalchemy.text(
+                "DROP INDEX ix_airports_icao_code"
+            ))
+
+    # Duplicated ICAO codes have to be resolved by hand first, so they
+    # do not stop the app from starting.
+    try:
+        with connection.begin_nested():
+            _create_indexes(connection, airport_table, "ix_airports_icao_code")
+    except IntegrityError as e:
+        logger.error(
+            "Unique ICAO code index not created, duplicated codes have "
+            "to be removed first: %s",
+            e.orig,
+        )
+
+
+def _convert_sky_to_jsonb(connection: sqlalchemy.Connection) -> None:
+    """Function converting pickled METAR sky layers into JSONB.
+
+    Earlier versions stored the layers as pickled lists, which can only
+    be read in Python, so the rows are unpickled and written back in
+    batches of `SKY_BATCH_SIZE`, keeping the memory use bounded.
+
+    Args:
+        connection (sqlalchemy.Connection): The schema connection.
+    """
+    connection.execute(sqlalchemy.text(
+        "ALTER TABLE metars ADD COLUMN sky_json JSONB"
+    ))
+    select_batch = sqlalchemy.text(
+        "SELECT id, sky FROM metars "
+        "WHERE id > :last_id AND sky IS NOT NULL "
+        "ORDER BY id LIMIT :limit"
+    )
+    update = sqlalchemy.text(
+        "UPDATE metars SET sky_json = :sky WHERE id = :id"
+    ).bindparams(sqlalchemy.bindparam("sky", type_=JSONB))
+    last_id = 0
+    while rows := connection.execute(
+        select_batch,
+        {"last_id": last_id, "limit": SKY_BATCH_SIZE},
+    ).all():
+        connection.execute(update, [
+            {"id": report_id, "sky": list(pickle.loads(sky))}
+            for report_id, sky in rows
+        ])
+        last_id = rows[-1][0]
+    connection.execute(sqlalchemy.text(
+        "ALTER TABLE metars DROP COLUMN sky"
+    ))
+    connection.execute(sqlalchemy.text(
+        "ALTER TABLE metars RENAME COLUMN sky_json TO sky"
+    ))
+
+
+def _create_indexes(
+    connection: sqlalchemy.Connection,
+    table: sqlalchemy.Table,
+    *names: str,
+) -> None:
+    """Function creating the declared table indexes missing in the DB.
+
+    Args:
+        connection (sqlalchemy.Connection): The schema connection.
+        table (sqlalchemy.Table): The indexed table.
+        *names (str): The names of the indexes.
+    """
+    for index in table.indexes:
+        if index.name in names:
+            connection.execute(CreateIndex(index, if_not_exists=True))
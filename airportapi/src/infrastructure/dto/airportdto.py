@@ -1,7 +1,7 @@
 """A module containing DTO models for output airports."""
 
 
-from typing import Optional
+from typing import Iterable, Optional
 from asyncpg import Record  # type: ignore
 from pydantic import UUID4, BaseModel, ConfigDict
 
@@ -16,8 +16,8 @@ class AirportDTO(BaseModel):
     icao_code: str
     iata_code: str
     country: CountryDTO
-    latitude: str
-    longitude: str
+    latitude: float
+    longitude: float
     elevation: int
     vor_freq: Optional[str] = None
     dme_freq: Optional[str] = None
@@ -28,42 +28,106 @@ class AirportDTO(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         extra="ignore",
-        arbitrary_types_allowed=True,
+        defer_build=False,
+        revalidate_instances="never",
     )
 
     @classmethod
     def from_record(cls, record: Record) -> "AirportDTO":
         """A method for preparing DTO instance based on DB record.
 
+        The record comes from the joined airport query, so the validation
+        is skipped.
+
         Args:
             record (Record): The DB record.
 
         Returns:
             AirportDTO: The final DTO instance.
         """
-        record_dict = dict(record)
-
-        return cls(
-            id=record_dict.get("id"),  # type: ignore
-            name=record_dict.get("name"),  # type: ignore
-            icao_code=record_dict.get("icao_code"),  # type: ignore
-            iata_code=record_dict.get("iata_code"),  # type: ignore
-            country=CountryDTO(
-                id=record_dict.get("id_1"),
-                name=record_dict.get("name_1"),
-                alias=record_dict.get("alias"),
-                continent=Continent(
-                    id=record_dict.get("id_2"),  # type: ignore
-                    name=record_dict.get("name_2"),  # type: ignore
-                    alias=record_dict.get("alias_1"),  # type: ignore
+        return cls.model_construct(
+            id=record["id"],
+            name=record["name"],
+            icao_code=record["icao_code"],
+            iata_code=record["iata_code"],
+            country=CountryDTO.model_construct(
+                id=record["id_1"],
+                name=record["name_1"],
+                alias=record["alias"],
+                continent=Continent.model_construct(
+                    id=record["id_2"],
+                    name=record["name_2"],
+                    alias=record["alias_1"],
                 ),
             ),
-            latitude=record_dict.get("latitude"),  # type: ignore
-            longitude=record_dict.get("longitude"),  # type: ignore
-            elevation=record_dict.get("elevation"),  # type: ignore
-            vor_freq=record_dict.get("vor_freq"),
-            dme_freq=record_dict.get("dme_freq"),
-            ils_loc_freq=record_dict.get("ils_loc_freq"),
-            ils_gs_freq=record_dict.get("ils_gs_freq"),
-            user_id=record_dict.get("user_id"),
+            latitude=record["latitude"],
+            longitude=record["longitude"],
+            elevation=record["elevation"],
+            vor_freq=record["vor_freq"],
+            dme_freq=record["dme_freq"],
+            ils_loc_freq=record["ils_loc_freq"],
+            ils_gs_freq=record["ils_gs_freq"],
+            user_id=record["user_id"],
         )
+
+    @classmethod
+    def from_records(cls, records: Iterable[Record]) -> list["AirportDTO"]:
+        """A method for preparing DTO instances based on DB records.
+
+        The records come from the joined airport query, so the validation
+        is skipped and the column positions are resolved only once.
+
+        Args:
+            records (Iterable[Record]): The DB records.
+
+        Returns:
+            list[AirportDTO]: The final DTO instances.
+        """
+        records = list(records)
+        if not records:
+            return []
+
+        index = {key: i for i, key in enumerate(records[0].keys())}
+        i_id, i_name = index["id"], index["name"]
+        i_icao, i_iata = index["icao_code"], index["iata_code"]
+        i_country_id, i_country_name = index["id_1"], index["name_1"]
+        i_country_alias = index["alias"]
+        i_continent_id, i_continent_name = index["id_2"], index["name_2"]
+        i_continent_alias = index["alias_1"]
+        i_lat, i_lon = index["latitude"], index["longitude"]
+        i_elevation = index["elevation"]
+        i_vor, i_dme = index["vor_freq"], index["dme_freq"]
+        i_ils_loc, i_ils_gs = index["ils_loc_freq"], index["ils_gs_freq"]
+        i_user_id = index["user_id"]
+
+        airports = []
+        for record in records:
+            rec = tuple(record.values())
+            airports.append(
+                cls.model_construct(
+                    id=rec[i_id],
+                    name=rec[i_name],
+                    icao_code=rec[i_icao],
+                    iata_code=rec[i_iata],
+                    country=CountryDTO.model_construct(
+                        id=rec[i_country_id],
+                        name=rec[i_country_name],
+                        alias=rec[i_country_alias],
+                        continent=Continent.model_construct(
+                            id=rec[i_continent_id],
+                            name=rec[i_continent_name],
+                            alias=rec[i_continent_alias],
+                        ),
+                    ),
+                    latitude=rec[i_lat],
+                    longitude=rec[i_lon],
+                    elevation=rec[i_elevation],
+                    vor_freq=rec[i_vor],
+                    dme_freq=rec[i_dme],
+                    ils_loc_freq=rec[i_ils_loc],
+                    ils_gs_freq=rec[i_ils_gs],
+                    user_id=rec[i_user_id],
+                )
+            )
+
+        return airports
@@ -16,5 +16,6 @@ class CountryDTO(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         extra="ignore",
-        arbitrary_types_allowed=True,
+        defer_build=False,
+        revalidate_instances="never",
     )
@@ -0,0 +1,17 @@
+"""A module containing DTO model for bulk METAR uploads."""
+
+
+from pydantic import BaseModel, ConfigDict
+
+from src.core.domain.meteo import MetarReport
+
+
+class MetarBulkDTO(BaseModel):
+    """A model representing the result of a bulk METAR upload."""
+    reports: list[MetarReport]
+    rejected: list[int]
+
+    model_config = ConfigDict(
+        from_attributes=True,
+        extra="ignore",
+    )
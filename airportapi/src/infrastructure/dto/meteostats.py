@@ -8,29 +8,29 @@ from pydantic import BaseModel, ConfigDict
 class MeteoStatsDTO(BaseModel):
     """A model with meteo statistics"""
 
-    start_time: datetime
-    end_time: datetime
+    start_time: datetime | None
+    end_time: datetime | None
     icao_code: str
 
-    avg_temperature: float
-    min_temperature: float
-    max_temperature: float
+    avg_temperature: float | None
+    min_temperature: float | None
+    max_temperature: float | None
 
-    avg_wind_speed: float
-    min_wind_speed: float
-    max_wind_speed: float
+    avg_wind_speed: float | None
+    min_wind_speed: float | None
+    max_wind_speed: float | None
 
-    avg_rvr: float
-    min_rvr: float
-    max_rvr: float
+    avg_rvr: float | None
+    min_rvr: float | None
+    max_rvr: float | None
 
-    avg_dew_point: float
-    min_dew_point: float
-    max_dew_point: float
+    avg_dew_point: float | None
+    min_dew_point: float | None
+    max_dew_point: float | None
 
-    avg_qhn: float
-    min_qhn: float
-    max_qhn: float
+    avg_qhn: float | None
+    min_qhn: float | None
+    max_qhn: float | None
 
     model_config = ConfigDict(
         from_attributes=True,
@@ -1,20 +1,233 @@
 """Module containing airport repository implementation."""
 
-from typing import Any, Iterable
-
-from asyncpg import Record  # type: ignore
-from sqlalchemy import select, join
+import math
+from itertools import chain
+from typing import Any, AsyncIterator, Iterable
+
+from sqlalchemy import (
+    Float,
+    bindparam,
+    func,
+    join,
+    literal_column,
+    select,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
 from src.core.repositories.iairport import IAirportRepository
 from src.core.domain.airport import Airport, AirportBroker
 from src.db import (
     airport_table,
+    compile_named_query,
+    compile_query,
     continent_table,
     country_table,
     database,
+    fetch_raw,
+    fetch_raw_row,
+    fetch_raw_val,
+    iterate_raw,
 )
 from src.infrastructure.dto.airportdto import AirportDTO
 
+airport_details_join = join(
+    airport_table,
+    join(
+        country_table,
+        continent_table,
+        country_table.c.continent_id == continent_table.c.id,
+    ),
+    airport_table.c.country_id == country_table.c.id,
+)
+# Only the columns used by AirportDTO, labeled as in the full join.
+airport_details_query = select(
+    airport_table.c.id,
+    airport_table.c.name,
+    airport_table.c.icao_code,
+    airport_table.c.iata_code,
+    airport_table.c.latitude,
+    airport_table.c.longitude,
+    airport_table.c.elevation,
+    airport_table.c.vor_freq,
+    airport_table.c.dme_freq,
+    airport_table.c.ils_loc_freq,
+    airport_table.c.ils_gs_freq,
+    airport_table.c.user_id,
+    country_table.c.id.label("id_1"),
+    country_table.c.name.label("name_1"),
+    country_table.c.alias,
+    continent_table.c.id.label("id_2"),
+    continent_table.c.name.label("name_2"),
+    continent_table.c.alias.label("alias_1"),
+).select_from(airport_details_join)
+GET_ALL_QUERY = compile_query(
+    airport_details_query.order_by(airport_table.c.name.asc())
+)
+GET_BY_ID_QUERY = compile_query(
+    airport_details_query.where(airport_table.c.id == bindparam("id"))
+)
+GET_BY_ICAO_QUERY = compile_query(
+    airport_details_query
+    .where(airport_table.c.icao_code == bindparam("icao_code"))
+)
+GET_BY_IATA_QUERY = compile_query(
+    airport_details_query
+    .where(airport_table.c.iata_code == bindparam("iata_code"))
+)
+GET_BY_COUNTRY_QUERY = compile_query(
+    airport_details_query
+    .where(airport_table.c.country_id == bindparam("country_id"))
+    .order_by(airport_table.c.name.asc())
+)
+GET_BY_CONTINENT_QUERY = compile_query(
+    airport_details_query
+    .where(country_table.c.continent_id == bindparam("continent_id"))
+    .order_by(airport_table.c.name.asc())
+)
+
+
+def _json_object(**fields: Any) -> Any:
+    """Function building a JSON object from the columns in SQL.
+
+    Args:
+        **fields (Any): The column expressions by JSON key.
+
+    Returns:
+        Any: The JSON object expression.
+    """
+    return func.json_build_object(*chain.from_iterable(
+        (literal_column(f"'{key}'"), value) for key, value in fields.items()
+    ))
+
+
+# The JSON mirrors the AirportDTO layout, so it can be sent as it is.
+airport_json = _json_object(
+    id=airport_table.c.id,
+    name=airport_table.c.name,
+    icao_code=airport_table.c.icao_code,
+    iata_code=airport_table.c.iata_code,
+    country=_json_object(
+        id=country_table.c.id,
+        name=country_table.c.name,
+        alias=country_table.c.alias,
+        continent=_json_object(
+            name=continent_table.c.name,
+            alias=continent_table.c.alias,
+            id=continent_table.c.id,
+        ),
+    ),
+    latitude=airport_table.c.latitude,
+    longitude=airport_table.c.longitude,
+    elevation=airport_table.c.elevation,
+    vor_freq=airport_table.c.vor_freq,
+    dme_freq=airport_table.c.dme_freq,
+    ils_loc_freq=airport_table.c.ils_loc_freq,
+    ils_gs_freq=airport_table.c.ils_gs_freq,
+    user_id=airport_table.c.user_id,
+)
+all_airports_json_query = select(
+    func.coalesce(
+        func.json_agg(
+            aggregate_order_by(airport_json, airport_table.c.name.asc())
+        ),
+        literal_column("'[]'::json"),
+    )
+).select_from(airport_details_join)
+GET_ALL_JSON_QUERY = compile_query(all_airports_json_query)
+GET_ALL_WITH_ICAO_JSON_QUERY = compile_query(
+    all_airports_json_query.where(
+        airport_table.c.icao_code.is_not(None),
+        airport_table.c.icao_code != literal_column("''"),
+    )
+)
+ITERATE_ALL_JSON_QUERY = compile_query(
+    select(airport_json)
+    .select_from(airport_details_join)
+    .order_by(airport_table.c.name.asc())
+)
+
+AIRPORT_VALUES = {
+    column.name: bindparam(column.name)
+    for column in airport_table.c
+    if column.name != "id"
+}
+INSERT_QUERY = compile_named_query(
+    airport_table.insert()
+    .values(AIRPORT_VALUES)
+    .returning(*airport_table.c)
+)
+UPDATE_QUERY = compile_named_query(
+    airport_table.update()
+    .where(
+        airport_table.c.id == bindparam("id"),
+        airport_table.c.user_id == bindparam("user_id"),
+    )
+    .values(AIRPORT_VALUES)
+    .returning(*airport_table.c)
+)
+DELETE_QUERY = compile_query(
+    airport_table.delete()
+    .where(airport_table.c.id == bindparam("id"))
+    .returning(airport_table.c.id)
+)
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def _haversine_km(latitude: Any, longitude: Any) -> Any:
+    """Function building the great-circle distance to an airport in SQL.
+
+    Rounding can push the haversine term just above 1 for near-antipodal
+    points, so it is capped before `asin`.
+
+    Args:
+        latitude (Any): The latitude of the center point.
+        longitude (Any): The longitude of the center point.
+
+    Returns:
+        Any: The distance expression in kilometres.
+    """
+    half = literal_column("0.5")
+    two = literal_column("2")
+    lat = func.radians(airport_table.c.latitude)
+    center_lat = func.radians(latitude)
+    half_dlat = (lat - center_lat) * half
+    half_dlon = (
+        func.radians(airport_table.c.longitude) - func.radians(longitude)
+    ) * half
+
+    return literal_column(str(2 * EARTH_RADIUS_KM)) * func.asin(func.sqrt(
+        func.least(
+            literal_column("1.0"),
+            func.power(func.sin(half_dlat), two)
+            + func.cos(center_lat) * func.cos(lat)
+            * func.power(func.sin(half_dlon), two),
+        )
+    ))
+
+
+# The bounding box lets the planner use ix_airports_location, the exact
+# distance filters out the box corners.
+GET_BY_LOCATION_QUERY = compile_query(
+    airport_details_query
+    .where(
+        airport_table.c.latitude.between(
+            bindparam("lat_min", type_=Float),
+            bindparam("lat_max", type_=Float),
+        ),
+        airport_table.c.longitude.between(
+            bindparam("lon_min", type_=Float),
+            bindparam("lon_max", type_=Float),
+        ),
+        _haversine_km(
+            bindparam("latitude", type_=Float),
+            bindparam("longitude", type_=Float),
+        ) <= bindparam("radius", type_=Float),
+    )
+    .order_by(airport_table.c.name.asc())
+)
+
 
 class AirportRepository(IAirportRepository):
     """A class representing continent DB repository."""
@@ -26,24 +239,34 @@ class AirportRepository(IAirportRepository):
             Iterable[Any]: Airports in the data storage.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .order_by(airport_table.c.name.asc())
+        airports = await fetch_raw(GET_ALL_QUERY)
+
+        return AirportDTO.from_records(airports)
+
+    async def get_all_airports_json(self, has_icao: bool = False) -> str:
+        """The method getting all airports serialized to JSON by the DB.
+
+        Args:
+            has_icao (bool, optional): Whether to skip airports without
+                an ICAO code. Defaults to False.
+
+        Returns:
+            str: The JSON array of airports in the data storage.
+        """
+
+        return await fetch_raw_val(
+            GET_ALL_WITH_ICAO_JSON_QUERY if has_icao else GET_ALL_JSON_QUERY
         )
-        airports = await database.fetch_all(query)
 
-        return [AirportDTO.from_record(airport) for airport in airports]
+    async def iterate_all_airports_json(self) -> AsyncIterator[str]:
+        """The method iterating over all airports serialized to JSON by the DB.
+
+        Yields:
+            str: The JSON object of the next airport.
+        """
+
+        async for airport in iterate_raw(ITERATE_ALL_JSON_QUERY):
+            yield airport[0]
 
     async def get_by_country(self, country_id: int) -> Iterable[Any]:
         """The method getting airports assigned to particular country.
@@ -55,13 +278,9 @@ class AirportRepository(IAirportRepository):
             Iterable[Any]: Airports assigned to a country.
         """
 
-        query = airport_table \
-            .select() \
-            .where(airport_table.c.country_id == country_id) \
-            .order_by(airport_table.c.name.asc())
-        airports = await database.fetch_all(query)
+        airports = await fetch_raw(GET_BY_COUNTRY_QUERY, country_id)
 
-        return [Airport(**dict(airport)) for airport in airports]
+        return AirportDTO.from_records(airports)
 
     async def get_by_continent(self, continent_id: int) -> Iterable[Any]:
         """The method getting airports assigned to particular continent.
@@ -73,22 +292,9 @@ class AirportRepository(IAirportRepository):
             Iterable[Any]: Airports assigned to a continent.
         """
 
-        query = (
-            select(airport_table)
-            .select_from(
-                join(
-                    airport_table,
-                    country_table,
-                    airport_table.c.country_id == country_table.c.id,
-                )
-            )
-            .where(country_table.c.continent_id == continent_id)
-            .order_by(airport_table.c.name.asc())
-        )
-
-        airports = await database.fetch_all(query)
+        airports = await fetch_raw(GET_BY_CONTINENT_QUERY, continent_id)
 
-        return [Airport(**dict(airport)) for airport in airports]
+        return AirportDTO.from_records(airports)
 
     async def get_by_id(self, airport_id: int) -> Any | None:
         """The method getting airport by provided id.
@@ -100,23 +306,7 @@ class AirportRepository(IAirportRepository):
             Any | None: The airport details.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id,
-                )
-            )
-            .where(airport_table.c.id == airport_id)
-            .order_by(airport_table.c.name.asc())
-        )
-        airport = await database.fetch_one(query)
+        airport = await fetch_raw_row(GET_BY_ID_QUERY, airport_id)
 
         return AirportDTO.from_record(airport) if airport else None
 
@@ -130,23 +320,7 @@ class AirportRepository(IAirportRepository):
             Any | None: The airport details.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .where(airport_table.c.icao_code == icao_code)
-            .order_by(airport_table.c.name.asc())
-        )
-        airport = await database.fetch_one(query)
+        airport = await fetch_raw_row(GET_BY_ICAO_QUERY, icao_code)
 
         return AirportDTO.from_record(airport) if airport else None
 
@@ -160,23 +334,7 @@ class AirportRepository(IAirportRepository):
             Any | None: The airport details.
         """
 
-        query = (
-            select(airport_table, country_table, continent_table)
-            .select_from(
-                join(
-                    airport_table,
-                    join(
-                        country_table,
-                        continent_table,
-                        country_table.c.continent_id == continent_table.c.id
-                    ),
-                    airport_table.c.country_id == country_table.c.id
-                )
-            )
-            .where(airport_table.c.iata_code == iata_code)
-            .order_by(airport_table.c.name.asc())
-        )
-        airport = await database.fetch_one(query)
+        airport = await fetch_raw_row(GET_BY_IATA_QUERY, iata_code)
 
         return AirportDTO.from_record(airport) if airport else None
 
@@ -203,13 +361,35 @@ class AirportRepository(IAirportRepository):
         Args:
             latitude (float): The geographical latitude.
             longitude (float): The geographical longitude.
-            radius (float): The radius airports to search.
+            radius (float): The radius airports to search in kilometres.
 
         Returns:
             Iterable[Any]: The result airport collection.
         """
 
-        return []
+        lat_delta = radius / KM_PER_DEGREE
+        lat_min = max(latitude - lat_delta, -90.0)
+        lat_max = min(latitude + lat_delta, 90.0)
+
+        cos_lat = math.cos(math.radians(max(abs(lat_min), abs(lat_max))))
+        lon_delta = lat_delta / cos_lat if cos_lat > 0 else 180.0
+        if lon_delta >= 180.0 or abs(longitude) + lon_delta > 180.0:
+            lon_min, lon_max = -180.0, 180.0
+        else:
+            lon_min, lon_max = longitude - lon_delta, longitude + lon_delta
+
+        airports = await fetch_raw(
+            GET_BY_LOCATION_QUERY,
+            lat_min,
+            lat_max,
+            lon_min,
+            lon_max,
+            latitude,
+            longitude,
+            radius,
+        )
+
+        return AirportDTO.from_records(airports)
 
     async def add_airport(self, data: AirportBroker) -> Any | None:
         """The method adding new airport to the data storage.
@@ -224,11 +404,38 @@ class AirportRepository(IAirportRepository):
             Any | None: The newly added airport.
         """
 
-        query = airport_table.insert().values(**data.model_dump())
-        new_airport_id = await database.execute(query)
-        new_airport = await self._get_by_id(new_airport_id)
+        new_airport = await fetch_raw_row(
+            INSERT_QUERY.sql,
+            *INSERT_QUERY.bind(data.model_dump()),
+        )
+
+        return Airport.model_construct(**new_airport) if new_airport else None
+
+    async def add_airports(
+        self,
+        data: Iterable[AirportBroker],
+    ) -> Iterable[Any]:
+        """The method adding many airports to the data storage at once.
+
+        Args:
+            data (Iterable[AirportBroker]): The details of the airports.
+
+        Returns:
+            Iterable[Any]: The newly created airports.
+        """
+
+        values = [airport.model_dump() for airport in data]
+        if not values:
+            return []
+
+        query = (
+            airport_table.insert()
+            .values(values)
+            .returning(*airport_table.c)
+        )
+        airports = await database.fetch_all(query)
 
-        return Airport(**dict(new_airport)) if new_airport else None
+        return [Airport.model_construct(**airport) for airport in airports]
 
     async def update_airport(
         self,
@@ -237,6 +444,8 @@ class AirportRepository(IAirportRepository):
     ) -> Any | None:
         """The method updating airport data in the data storage.
 
+        Only the airport added by the user from the details is updated.
+
         Args:
             airport_id (int): The id of the airport.
             data (AirportBroker): The details of the updated airport.
@@ -245,19 +454,12 @@ class AirportRepository(IAirportRepository):
             Any | None: The updated airport details.
         """
 
-        if self._get_by_id(airport_id):
-            query = (
-                airport_table.update()
-                .where(airport_table.c.id == airport_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            airport = await self._get_by_id(airport_id)
-
-            return Airport(**dict(airport)) if airport else None
+        airport = await fetch_raw_row(
+            UPDATE_QUERY.sql,
+            *UPDATE_QUERY.bind({"id": airport_id, **data.model_dump()}),
+        )
 
-        return None
+        return Airport.model_construct(**airport) if airport else None
 
     async def delete_airport(self, airport_id: int) -> bool:
         """The method updating removing airport from the data storage.
@@ -269,30 +471,6 @@ class AirportRepository(IAirportRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(airport_id):
-            query = airport_table \
-                .delete() \
-                .where(airport_table.c.id == airport_id)
-            await database.execute(query)
-
-            return True
-
-        return False
-
-    async def _get_by_id(self, airport_id: int) -> Record | None:
-        """A private method getting airport from the DB based on its ID.
-
-        Args:
-            airport_id (int): The ID of the airport.
-
-        Returns:
-            Any | None: Airport record if exists.
-        """
-
-        query = (
-            airport_table.select()
-            .where(airport_table.c.id == airport_id)
-            .order_by(airport_table.c.name.asc())
-        )
+        deleted_id = await fetch_raw_val(DELETE_QUERY, airport_id)
 
-        return await database.fetch_one(query)
+        return deleted_id is not None
@@ -3,10 +3,43 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
+from sqlalchemy import bindparam
 
 from src.core.domain.location import Continent, ContinentIn
 from src.core.repositories.icontinent import IContinentRepository
-from src.db import continent_table, database
+from src.db import (
+    compile_named_query,
+    compile_query,
+    continent_table,
+    database,
+    fetch_raw,
+    fetch_raw_row,
+    fetch_raw_val,
+)
+
+GET_BY_ID_QUERY = compile_query(
+    continent_table.select()
+    .where(continent_table.c.id == bindparam("id"))
+)
+GET_ALL_QUERY = compile_query(
+    continent_table.select().order_by(continent_table.c.name.asc())
+)
+INSERT_QUERY = compile_named_query(
+    continent_table.insert()
+    .values(name=bindparam("name"), alias=bindparam("alias"))
+    .returning(*continent_table.c)
+)
+UPDATE_QUERY = compile_named_query(
+    continent_table.update()
+    .where(continent_table.c.id == bindparam("id"))
+    .values(name=bindparam("name"), alias=bindparam("alias"))
+    .returning(*continent_table.c)
+)
+DELETE_QUERY = compile_query(
+    continent_table.delete()
+    .where(continent_table.c.id == bindparam("id"))
+    .returning(continent_table.c.id)
+)
 
 
 class ContinentRepository(IContinentRepository):
@@ -24,7 +57,7 @@ class ContinentRepository(IContinentRepository):
 
         continent = await self._get_by_id(continent_id)
 
-        return Continent(**dict(continent)) if continent else None
+        return Continent.model_construct(**continent) if continent else None
 
     async def get_all_continents(self) -> Iterable[Any]:
         """The method getting all continents from the data storage.
@@ -33,10 +66,12 @@ class ContinentRepository(IContinentRepository):
             Iterable[Any]: The collection of the all continents.
         """
 
-        query = continent_table.select().order_by(continent_table.c.name.asc())
-        continents = await database.fetch_all(query)
+        continents = await fetch_raw(GET_ALL_QUERY)
 
-        return [Continent(**dict(continent)) for continent in continents]
+        return [
+            Continent.model_construct(**continent)
+            for continent in continents
+        ]
 
     async def add_continent(self, data: ContinentIn) -> Any | None:
         """The method adding new continent to the data storage.
@@ -48,11 +83,44 @@ class ContinentRepository(IContinentRepository):
             Any | None: The newly created continent.
         """
 
-        query = continent_table.insert().values(**data.model_dump())
-        new_continent_id = await database.execute(query)
-        new_continent = await self._get_by_id(new_continent_id)
+        new_continent = await fetch_raw_row(
+            INSERT_QUERY.sql,
+            *INSERT_QUERY.bind(data.model_dump()),
+        )
+
+        return (
+            Continent.model_construct(**new_continent)
+            if new_continent else None
+        )
+
+    async def add_continents(
+        self,
+        data: Iterable[ContinentIn],
+    ) -> Iterable[Any]:
+        """The method adding many continents to the data storage at once.
+
+        Args:
+            data (Iterable[ContinentIn]): The attributes of the continents.
+
+        Returns:
+            Iterable[Any]: The newly created continents.
+        """
 
-        return Continent(**dict(new_continent)) if new_continent else None
+        values = [continent.model_dump() for continent in data]
+        if not values:
+            return []
+
+        query = (
+            continent_table.insert()
+            .values(values)
+            .returning(*continent_table.c)
+        )
+        continents = await database.fetch_all(query)
+
+        return [
+            Continent.model_construct(**continent)
+            for continent in continents
+        ]
 
     async def update_continent(
         self,
@@ -66,22 +134,15 @@ class ContinentRepository(IContinentRepository):
             data (ContinentIn): The attributes of the continent.
 
         Returns:
-            Any | None: The updated continent.
+            Any | None: The updated continent if exists.
         """
 
-        if self._get_by_id(continent_id):
-            query = (
-                continent_table.update()
-                .where(continent_table.c.id == continent_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            continent = await self._get_by_id(continent_id)
-
-            return Continent(**dict(continent)) if continent else None
+        continent = await fetch_raw_row(
+            UPDATE_QUERY.sql,
+            *UPDATE_QUERY.bind({"id": continent_id, **data.model_dump()}),
+        )
 
-        return None
+        return Continent.model_construct(**continent) if continent else None
 
     async def delete_continent(self, continent_id: int) -> bool:
         """The method updating removing continent from the data storage.
@@ -93,15 +154,9 @@ class ContinentRepository(IContinentRepository):
             bool: Success of the operation.
         """
 
-        if self._get_by_id(continent_id):
-            query = continent_table \
-                .delete() \
-                .where(continent_table.c.id == continent_id)
-            await database.execute(query)
-
-            return True
+        deleted_id = await fetch_raw_val(DELETE_QUERY, continent_id)
 
-        return False
+        return deleted_id is not None
 
     async def _get_by_id(self, continent_id: int) -> Record | None:
         """A private method getting continent from the DB based on its ID.
@@ -113,10 +168,4 @@ class ContinentRepository(IContinentRepository):
             Any | None: Continent record if exists.
         """
 
-        query = (
-            continent_table.select()
-            .where(continent_table.c.id == continent_id)
-            .order_by(continent_table.c.name.asc())
-        )
-
-        return await database.fetch_one(query)
+        return await fetch_raw_row(GET_BY_ID_QUERY, continent_id)
@@ -3,10 +3,56 @@
 from typing import Any, Iterable
 
 from asyncpg import Record  # type: ignore
+from sqlalchemy import bindparam
 
 from src.core.domain.location import Country, CountryIn
 from src.core.repositories.icountry import ICountryRepository
-from src.db import country_table, database
+from src.db import (
+    compile_named_query,
+    compile_query,
+    country_table,
+    database,
+    fetch_raw,
+    fetch_raw_row,
+    fetch_raw_val,
+)
+
+GET_BY_ID_QUERY = compile_query(
+    country_table.select()
+    .where(country_table.c.id == bindparam("id"))
+)
+GET_ALL_QUERY = compile_query(
+    country_table.select().order_by(country_table.c.name.asc())
+)
+GET_BY_CONTINENT_QUERY = compile_query(
+    country_table.select()
+    .where(country_table.c.continent_id == bindparam("continent_id"))
+    .order_by(country_table.c.name.asc())
+)
+INSERT_QUERY = compile_named_query(
+    country_table.insert()
+    .values(
+        name=bindparam("name"),
+        alias=bindparam("alias"),
+        continent_id=bindparam("continent_id"),
+    )
+    .returning(*country_table.c)
+)
+UPDATE_QUERY = compile_named_query(
+    country_table.update()
+    .where(country_table.c.id == bindparam("id"))
+    .values(
+        name=bindparam("name"),
+        alias=bindparam("alias"),
+        continent_id=bindparam("continent_id"),
+    )
+    .returning(*country_table.c)
+)
+DELETE_QUERY = compile_query(
+    country_table.delete()
+    .where(country_table.c.id == bindparam("id"))
+    .returning(country_table.c.id)
+)
 
 
 class CountryRepository(ICountryRepository):
@@ -24,7 +70,7 @@ class CountryRepository(ICountryRepository):
 
         country = await self._get_by_id(country_id)
 
-        return Country(**dict(country)) if country else None
+        return Country.model_construct(**country) if country else None
 
     async def get_all_countries(self) -> Iterable[Any]:
         """The abstract getting all countries from the data storage.
@@ -33,10 +79,9 @@ class CountryRepository(ICountryRepository):
             Iterable[Any]: The collection of the all countries.
         """
 
-        query = country_table.select().order_by(country_table.c.name.asc())
-        countries = await database.fetch_all(query)
+        countries = await fetch_raw(GET_ALL_QUERY)
 
-        return [Country(**dict(country)) for country in countries]
+        return [Country.model_construct(**country) for country in countries]
 
     async def get_countries_by_continent(
         self,
@@ -52,13 +97,9 @@ class CountryRepository(ICountryRepository):
             Iterable[Any]: The collection of the countries.
         """
 
-        query = country_table \
-            .select() \
-            .where(country_table.c.continent_id == continent_id) \
-            .order_by(country_table.c.name.asc())
-        countries = await database.fetch_all(query)
+        countries = await fetch_raw(GET_BY_CONTINENT_QUERY, continent_id)
 
-        return [Country(**dict(country)) for country in countries]
+        return [Country.model_construct(**country) for country in countries]
 
     async def add_country(self, data: CountryIn) -> Any | None:
         """The abstract adding new country to the data storage.
@@ -70,11 +111,35 @@ class CountryRepository(ICountryRepository):
             Any | None: The newly created country.
         """
 
-        query = country_table.insert().values(**data.model_dump())
-        new_country_id = await database.execute(query)
-        new_country = await self._get_by_id(new_country_id)
+        new_country = await fetch_raw_row(
+            INSERT_QUERY.sql,
+            *INSERT_QUERY.bind(data.model_dump()),
+        )
+
+        return Country.model_construct(**new_country) if new_country else None
+
+    async def add_countries(self, data: Iterable[CountryIn]) -> Iterable[Any]:
+        """The method adding many countries to the data storage at once.
+
+        Args:
+            data (Iterable[CountryIn]): The attributes of the countries.
+
+        Returns:
+            Iterable[Any]: The newly created countries.
+        """
+
+        values = [country.model_dump() for country in data]
+        if not values:
+            return []
+
+        query = (
+            country_table.insert()
+            .values(values)
+            .returning(*country_table.c)
+        )
+        countries = await database.fetch_all(query)
 
-        return Country(**dict(new_country)) if new_country else None
+        return [Country.model_construct(**country) for country in countries]
 
     async def update_country(
             self,
@@ -88,39 +153,29 @@ class CountryRepository(ICountryRepository):
             data (CountryIn): The attributes of the country.
 
         Returns:
-            Any | None: The updated country.
+            Any | None: The updated country if exists.
         """
 
-        if self._get_by_id(country_id):
-            query = (
-                country_table.update()
-                .where(country_table.c.id == country_id)
-                .values(**data.model_dump())
-            )
-            await database.execute(query)
-
-            country = await self._get_by_id(country_id)
-
-            return Country(**dict(country)) if country else None
+        country = await fetch_raw_row(
+            UPDATE_QUERY.sql,
+            *UPDATE_QUERY.bind({"id": country_id, **data.model_dump()}),
+        )
 
-        return None
+        return Country.model_construct(**country) if country else None
 
     async def delete_country(self, country_id: int) -> bool:
         """The abstract updating removing country from the data storage.
 
         Args:
             country_id (int): The country id.
-        """
 
-        if self._get_by_id(country_id):
-            query = country_table \
-                .delete() \
-                .where(country_table.c.id == country_id)
-            await database.execute(query)
+        Returns:
+            bool: Success of the operation.
+        """
 
-            return True
+        deleted_id = await fetch_raw_val(DELETE_QUERY, country_id)
 
-        return False
+        return deleted_id is not None
 
     async def _get_by_id(self, country_id: int) -> Record | None:
         """A private method getting country from the DB based on its ID.
@@ -132,10 +187,4 @@ class CountryRepository(ICountryRepository):
             Any | None: Country record if exists.
         """
 
-        query = (
-            country_table.select()
-            .where(country_table.c.id == country_id)
-            .order_by(country_table.c.name.asc())
-        )
-
-        return await database.fetch_one(query)
+        return await fetch_raw_row(GET_BY_ID_QUERY, country_id)
@@ -2,15 +2,83 @@
 
 
 from datetime import datetime
-import pickle
-from typing import Any, Iterable, Optional
+from itertools import chain
+from typing import Any, AsyncIterator, Iterable, Optional
 
 from asyncpg import Record  # type: ignore
+import orjson
 import sqlalchemy
+from sqlalchemy import bindparam, func, literal_column
 
 from src.core.domain.meteo import MetarReport, MetarReportIn
 from src.core.repositories.imeteo import IMeteoRepository
-from src.db import database, metar_table
+from src.db import (
+    compile_query,
+    database,
+    fetch_raw,
+    fetch_raw_row,
+    fetch_raw_val,
+    iterate_raw,
+    metar_table,
+)
+
+GET_BY_ID_QUERY = compile_query(
+    metar_table.select().where(metar_table.c.id == bindparam("id"))
+)
+GET_ALL_QUERY = compile_query(
+    metar_table.select().order_by(metar_table.c.id.asc())
+)
+# The JSON mirrors the MetarReport layout, so it can be sent as it is.
+REPORT_JSON = func.json_build_object(*chain.from_iterable(
+    (literal_column(f"'{column.name}'"), column)
+    for column in (
+        *(column for column in metar_table.c if column.name != "id"),
+        metar_table.c.id,
+    )
+))
+ITERATE_ALL_JSON_QUERY = compile_query(
+    sqlalchemy.select(REPORT_JSON).order_by(metar_table.c.id.asc())
+)
+DELETE_QUERY = compile_query(
+    metar_table.delete()
+    .where(metar_table.c.id == bindparam("id"))
+    .returning(metar_table.c.id)
+)
+AIRPORT_PERIOD_CONDITION = sqlalchemy.and_(
+    metar_table.c.icao_code == bindparam("icao_code"),
+    metar_table.c.date_time.between(
+        bindparam("start_date"),
+        bindparam("end_date"),
+    ),
+)
+GET_BY_AIRPORT_QUERY = compile_query(
+    metar_table.select()
+    .where(AIRPORT_PERIOD_CONDITION)
+    .order_by(metar_table.c.date_time.asc())
+)
+STATS_COLUMNS = {
+    "temperature": metar_table.c.temp,
+    "wind_speed": metar_table.c.wind_speed,
+    "rvr": metar_table.c.rvr,
+    "dew_point": metar_table.c.dew_point,
+    "qhn": metar_table.c.qnh,
+}
+STATS_AGGREGATES = [
+    aggregate(column).label(f"{prefix}_{name}")
+    for name, column in STATS_COLUMNS.items()
+    for prefix, aggregate in (
+        ("avg", func.avg),
+        ("min", func.min),
+        ("max", func.max),
+    )
+]
+GET_STATS_QUERY = compile_query(
+    sqlalchemy.select(
+        *STATS_AGGREGATES,
+        func.min(metar_table.c.date_time).label("first_time"),
+        func.max(metar_table.c.date_time).label("last_time"),
+    ).where(AIRPORT_PERIOD_CONDITION)
+)
 
 
 class MeteoRepository(IMeteoRepository):
@@ -23,10 +91,19 @@ class MeteoRepository(IMeteoRepository):
             Iterable[Any]: The all meteo reports.
         """
 
-        query = metar_table.select().order_by(metar_table.c.id.asc())
-        reports = await database.fetch_all(query)
+        reports = await fetch_raw(GET_ALL_QUERY)
 
-        return [MetarReport(**self._map_report(report)) for report in reports]
+        return [_build_report(report) for report in reports]
+
+    async def iterate_all_reports_json(self) -> AsyncIterator[str]:
+        """A method iterating over all reports serialized to JSON by the DB.
+
+        Yields:
+            str: The JSON object of the next report.
+        """
+
+        async for report in iterate_raw(ITERATE_ALL_JSON_QUERY):
+            yield report[0]
 
     async def get_by_airport(
         self,
@@ -47,19 +124,41 @@ class MeteoRepository(IMeteoRepository):
             Iterable[Any]: The filtered Metar reports.
         """
 
-        query_conditions = [metar_table.c.icao_code == icao_code]
-        if start_date:
-            query_conditions.append(metar_table.c.date_time >= start_date)
-        if end_date:
-            query_conditions.append(metar_table.c.date_time <= end_date)
+        reports = await fetch_raw(
+            GET_BY_AIRPORT_QUERY,
+            icao_code,
+            start_date or datetime.min,
+            end_date or datetime.max,
+        )
 
-        query = metar_table \
-            .select() \
-            .where(sqlalchemy.and_(*query_conditions)) \
-            .order_by(metar_table.c.date_time.asc())
-        reports = await database.fetch_all(query)
+        return [_build_report(report) for report in reports]
 
-        return [MetarReport(**self._map_report(report)) for report in reports]
+    async def get_stats(
+        self,
+        icao_code: str,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Any:
+        """A method aggregating reports from provided airport in the DB.
+
+        Args:
+            icao_code (str): The ICAO code of the airport.
+            start_date (Optional[datetime], optional): Start datetime.
+                Defaults to None.
+            end_date (Optional[datetime], optional): End datetime.
+                Defaults to None.
+
+        Returns:
+            Any: The averages, minimums and maximums of the measurements
+                with the times of the first and the last report.
+        """
+
+        return await fetch_raw_row(
+            GET_STATS_QUERY,
+            icao_code,
+            start_date or datetime.min,
+            end_date or datetime.max,
+        )
 
     async def get_by_id(self, report_id: int) -> Any | None:
         """A method returning report details by its ID.
@@ -71,14 +170,9 @@ class MeteoRepository(IMeteoRepository):
             Any | None: The Metar report.
         """
 
-        query = metar_table \
-            .select() \
-            .where(metar_table.c.id == report_id) \
-            .order_by(metar_table.c.id.asc())
-        report = await database.fetch_one(query)
-        report_dict = self._map_report(report)
+        report = await fetch_raw_row(GET_BY_ID_QUERY, report_id)
 
-        return MetarReport(**report_dict) if report else None
+        return _build_report(report) if report else None
 
     async def add_report(self, report: MetarReportIn) -> Any:
         """A method adding new METAR report to the DB.
@@ -90,11 +184,39 @@ class MeteoRepository(IMeteoRepository):
             Any: The Metar report.
         """
 
-        query = metar_table.insert().values(**report.model_dump())
-        new_airport_id = await database.execute(query)
-        new_airport = await self.get_by_id(new_airport_id)
+        query = metar_table \
+            .insert() \
+            .values(**report.model_dump()) \
+            .returning(*metar_table.c)
+        new_report = await database.fetch_one(query)
+
+        return MetarReport.model_construct(**new_report) \
+            if new_report else None
+
+    async def add_reports(self, reports: Iterable[MetarReportIn]) -> Any:
+        """A method adding many METAR reports to the DB at once.
+
+        Args:
+            reports (Iterable[MetarReportIn]): The input METAR reports.
+
+        Returns:
+            Any: The Metar reports.
+        """
+
+        values = [report.model_dump() for report in reports]
+        if not values:
+            return []
 
-        return new_airport
+        query = metar_table \
+            .insert() \
+            .values(values) \
+            .returning(*metar_table.c)
+        new_reports = await database.fetch_all(query)
+
+        return [
+            MetarReport.model_construct(**report)
+            for report in new_reports
+        ]
 
     async def add_text_report(self, text_report: str) -> Any:
         """A method adding new text METAR report to the DB.
@@ -107,40 +229,53 @@ class MeteoRepository(IMeteoRepository):
         """
 
         report_object = MetarReportIn.from_text_report(text_report)
-        query = metar_table.insert().values(**report_object.model_dump())
-        new_report_id = await database.execute(query)
-        new_report = await self.get_by_id(new_report_id)
 
-        return MetarReport(**dict(new_report)) \
-            if new_report else None
+        return await self.add_report(report_object)
 
-    async def remove_report(self, report_id: int) -> None:
+    async def remove_report(self, report_id: int) -> bool:
         """A method removing METAR report from DB.
 
         Args:
             report_id (int): The ID of the report.
+
+        Returns:
+            bool: Success of the operation.
         """
 
-        if self.get_by_id(report_id):
-            query = metar_table \
-                .delete() \
-                .where(metar_table.c.id == report_id)
-            await database.execute(query)
+        deleted_id = await fetch_raw_val(DELETE_QUERY, report_id)
 
-    def _map_report(self, report: Record | None) -> dict | None:
-        """A mapper method returning unpickled sky list.
+        return deleted_id is not None
 
-        Args:
-            report (Record | None): The METAR report record.
 
-        Returns:
-            dict | None: The mapped METAR record in dict form.
-        """
+def _build_report(record: Record) -> MetarReport:
+    """Function preparing a report from a raw asyncpg record.
+
+    The fields are read straight from the record, so no intermediate dict
+    is built. Raw asyncpg returns JSONB as text, so the sky layers are
+    decoded here.
+
+    Args:
+        record (Record): The METAR report record.
 
-        if not report:
-            return None
+    Returns:
+        MetarReport: The METAR report.
+    """
 
-        report_dict = dict(report)
-        report_dict["sky"] = pickle.loads(report_dict["sky"])
+    sky = record["sky"]
 
-        return report_dict
+    return MetarReport.model_construct(
+        id=record["id"],
+        icao_code=record["icao_code"],
+        date_time=record["date_time"],
+        wind_speed=record["wind_speed"],
+        wind_direction=record["wind_direction"],
+        wind_var_from=record["wind_var_from"],
+        wind_var_to=record["wind_var_to"],
+        wind_gust=record["wind_gust"],
+        rvr=record["rvr"],
+        rvr_direction=record["rvr_direction"],
+        dew_point=record["dew_point"],
+        sky=orjson.loads(sky) if sky is not None else None,
+        temp=record["temp"],
+        qnh=record["qnh"],
+    )
@@ -4,12 +4,20 @@
 from typing import Any
 
 from pydantic import UUID5
+from sqlalchemy import bindparam
 
 from src.infrastructure.utils.password import hash_password
 from src.core.domain.user import UserIn
 from src.core.repositories.iuser import IUserRepository
 from src.db import database, user_table
 
+GET_BY_UUID_QUERY = str(
+    user_table.select().where(user_table.c.id == bindparam("id"))
+)
+GET_BY_EMAIL_QUERY = str(
+    user_table.select().where(user_table.c.email == bindparam("email"))
+)
+
 
 class UserRepository(IUserRepository):
     """An implementation of repository class for user."""
@@ -44,10 +52,7 @@ class UserRepository(IUserRepository):
             Any | None: The user object if exists.
         """
 
-        query = user_table \
-            .select() \
-            .where(user_table.c.id == uuid)
-        user = await database.fetch_one(query)
+        user = await database.fetch_one(GET_BY_UUID_QUERY, {"id": uuid})
 
         return user
 
@@ -61,9 +66,6 @@ class UserRepository(IUserRepository):
             Any | None: The user object if exists.
         """
 
-        query = user_table \
-            .select() \
-            .where(user_table.c.email == email)
-        user = await database.fetch_one(query)
+        user = await database.fetch_one(GET_BY_EMAIL_QUERY, {"email": email})
 
         return user
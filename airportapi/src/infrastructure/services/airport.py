@@ -1,6 +1,6 @@
 """Module containing continent service implementation."""
 
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from src.core.domain.airport import Airport, AirportBroker
 from src.core.repositories.iairport import IAirportRepository
@@ -31,26 +31,54 @@ class AirportService(IAirportService):
 
         return await self._repository.get_all_airports()
 
-    async def get_by_country(self, country_id: int) -> Iterable[Airport]:
+    async def get_all_json(self, has_icao: bool = False) -> str:
+        """The method getting all airports serialized to JSON.
+
+        Args:
+            has_icao (bool, optional): Whether to skip airports without
+                an ICAO code. Defaults to False.
+
+        Returns:
+            str: The JSON array of all airports.
+        """
+
+        return await self._repository.get_all_airports_json(has_icao)
+
+    def stream_all_json(self) -> AsyncIterator[str]:
+        """The method streaming all airports serialized to JSON.
+
+        Yields:
+            str: The JSON object of the next airport.
+        """
+
+        return self._repository.iterate_all_airports_json()
+
+    async def get_by_country(
+        self,
+        country_id: int,
+    ) -> Iterable[AirportDTO]:
         """The method getting airports assigned to particular country.
 
         Args:
             country_id (int): The id of the country.
 
         Returns:
-            Iterable[Airport]: Airports assigned to a country.
+            Iterable[AirportDTO]: Airports assigned to a country.
         """
 
         return await self._repository.get_by_country(country_id)
 
-    async def get_by_continent(self, continent_id: int) -> Iterable[Airport]:
+    async def get_by_continent(
+        self,
+        continent_id: int,
+    ) -> Iterable[AirportDTO]:
         """The method getting airports assigned to particular continent.
 
         Args:
             continent_id (int): The id of the continent.
 
         Returns:
-            Iterable[Airport]: Airports assigned to a continent.
+            Iterable[AirportDTO]: Airports assigned to a continent.
         """
 
         return await self._repository.get_by_continent(continent_id)
@@ -108,16 +136,16 @@ class AirportService(IAirportService):
         latitude: float,
         longitude: float,
         radius: float,
-    ) -> Iterable[Airport]:
+    ) -> Iterable[AirportDTO]:
         """The method getting airports by raduis of the provided location.
 
         Args:
             latitude (float): The geographical latitude.
             longitude (float): The geographical longitude.
-            radius (float): The radius airports to search.
+            radius (float): The radius airports to search in kilometres.
 
         Returns:
-            Iterable[Airport]: The result airport collection.
+            Iterable[AirportDTO]: The result airport collection.
         """
 
         return await self._repository.get_by_location(
@@ -138,6 +166,21 @@ class AirportService(IAirportService):
 
         return await self._repository.add_airport(data)
 
+    async def add_airports(
+        self,
+        data: Iterable[AirportBroker],
+    ) -> Iterable[Airport]:
+        """The method adding many airports to the repository at once.
+
+        Args:
+            data (Iterable[AirportBroker]): The details of the airports.
+
+        Returns:
+            Iterable[Airport]: The newly created airports.
+        """
+
+        return await self._repository.add_airports(data)
+
     async def update_airport(
         self,
         airport_id: int,
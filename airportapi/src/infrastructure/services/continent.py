@@ -55,6 +55,21 @@ class ContinentService(IContinentService):
 
         return await self._repository.add_continent(data)
 
+    async def add_continents(
+        self,
+        data: Iterable[ContinentIn],
+    ) -> Iterable[Continent]:
+        """The method adding many continents to the repository at once.
+
+        Args:
+            data (Iterable[ContinentIn]): The attributes of the continents.
+
+        Returns:
+            Iterable[Continent]: The newly created continents.
+        """
+
+        return await self._repository.add_continents(data)
+
     async def update_continent(
         self,
         continent_id: int,
@@ -67,7 +82,7 @@ class ContinentService(IContinentService):
             data (ContinentIn): The attributes of the continent.
 
         Returns:
-            Continent | None: The updated continent.
+            Continent | None: The updated continent if exists.
         """
 
         return await self._repository.update_continent(
@@ -70,6 +70,21 @@ class CountryService(ICountryService):
 
         return await self._repository.add_country(data)
 
+    async def add_countries(
+        self,
+        data: Iterable[CountryIn],
+    ) -> Iterable[Country]:
+        """The method adding many countries to the repository at once.
+
+        Args:
+            data (Iterable[CountryIn]): The attributes of the countries.
+
+        Returns:
+            Iterable[Country]: The newly created countries.
+        """
+
+        return await self._repository.add_countries(data)
+
     async def update_country(
         self,
         country_id: int,
@@ -82,7 +97,7 @@ class CountryService(ICountryService):
             data (CountryIn): The attributes of the country.
 
         Returns:
-            Country | None: The updated country.
+            Country | None: The updated country if exists.
         """
 
         return await self._repository.update_country(
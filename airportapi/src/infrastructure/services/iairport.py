@@ -1,7 +1,7 @@
 """Module containing airport service abstractions."""
 
 from abc import ABC, abstractmethod
-from typing import Iterable
+from typing import AsyncIterator, Iterable
 
 from src.core.domain.airport import Airport, AirportBroker
 from src.infrastructure.dto.airportdto import AirportDTO
@@ -19,25 +19,51 @@ class IAirportService(ABC):
         """
 
     @abstractmethod
-    async def get_by_country(self, country_id: int) -> Iterable[Airport]:
+    async def get_all_json(self, has_icao: bool = False) -> str:
+        """The method getting all airports serialized to JSON.
+
+        Args:
+            has_icao (bool, optional): Whether to skip airports without
+                an ICAO code. Defaults to False.
+
+        Returns:
+            str: The JSON array of all airports.
+        """
+
+    @abstractmethod
+    def stream_all_json(self) -> AsyncIterator[str]:
+        """The method streaming all airports serialized to JSON.
+
+        Yields:
+            str: The JSON object of the next airport.
+        """
+
+    @abstractmethod
+    async def get_by_country(
+        self,
+        country_id: int,
+    ) -> Iterable[AirportDTO]:
         """The method getting airports assigned to particular country.
 
         Args:
             country_id (int): The id of the country.
 
         Returns:
-            Iterable[Airport]: Airports assigned to a country.
+            Iterable[AirportDTO]: Airports assigned to a country.
         """
 
     @abstractmethod
-    async def get_by_continent(self, continent_id: int) -> Iterable[Airport]:
+    async def get_by_continent(
+        self,
+        continent_id: int,
+    ) -> Iterable[AirportDTO]:
         """The method getting airports assigned to particular continent.
 
         Args:
             continent_id (int): The id of the continent.
 
         Returns:
-            Iterable[Airport]: Airports assigned to a continent.
+            Iterable[AirportDTO]: Airports assigned to a continent.
         """
 
     @abstractmethod
@@ -90,16 +116,16 @@ class IAirportService(ABC):
         latitude: float,
         longitude: float,
         radius: float,
-    ) -> Iterable[Airport]:
+    ) -> Iterable[AirportDTO]:
         """The method getting airports by raduis of the provided location.
 
         Args:
             latitude (float): The geographical latitude.
             longitude (float): The geographical longitude.
-            radius (float): The radius airports to search.
+            radius (float): The radius airports to search in kilometres.
 
         Returns:
-            Iterable[Airport]: The result airport collection.
+            Iterable[AirportDTO]: The result airport collection.
         """
 
     @abstractmethod
@@ -113,6 +139,20 @@ class IAirportService(ABC):
             Airport | None: Full details of the newly added airport.
         """
 
+    @abstractmethod
+    async def add_airports(
+        self,
+        data: Iterable[AirportBroker],
+    ) -> Iterable[Airport]:
+        """The abstract adding many airports to the repository at once.
+
+        Args:
+            data (Iterable[AirportBroker]): The details of the airports.
+
+        Returns:
+            Iterable[Airport]: The newly created airports.
+        """
+
     @abstractmethod
     async def update_airport(
         self,
@@ -39,6 +39,20 @@ class IContinentService(ABC):
             Continent | None: The newly created continent.
         """
 
+    @abstractmethod
+    async def add_continents(
+        self,
+        data: Iterable[ContinentIn],
+    ) -> Iterable[Continent]:
+        """The abstract adding many continents to the repository at once.
+
+        Args:
+            data (Iterable[ContinentIn]): The attributes of the continents.
+
+        Returns:
+            Iterable[Continent]: The newly created continents.
+        """
+
     @abstractmethod
     async def update_continent(
         self,
@@ -52,7 +66,7 @@ class IContinentService(ABC):
             data (ContinentIn): The attributes of the continent.
 
         Returns:
-            Continent | None: The updated continent.
+            Continent | None: The updated continent if exists.
         """
 
     @abstractmethod
@@ -55,6 +55,20 @@ class ICountryService(ABC):
             Country | None: The newly created country.
         """
 
+    @abstractmethod
+    async def add_countries(
+        self,
+        data: Iterable[CountryIn],
+    ) -> Iterable[Country]:
+        """The abstract adding many countries to the repository at once.
+
+        Args:
+            data (Iterable[CountryIn]): The attributes of the countries.
+
+        Returns:
+            Iterable[Country]: The newly created countries.
+        """
+
     @abstractmethod
     async def update_country(
         self,
@@ -68,7 +82,7 @@ class ICountryService(ABC):
             data (CountryIn): The attributes of the country.
 
         Returns:
-            Country | None: The updated country.
+            Country | None: The updated country if exists.
         """
 
     @abstractmethod
@@ -3,9 +3,10 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import AsyncIterator, Iterable, Optional
 
 from src.core.domain.meteo import MetarReport, MetarReportIn
+from src.infrastructure.dto.metarbulkdto import MetarBulkDTO
 from src.infrastructure.dto.meteostats import MeteoStatsDTO
 
 
@@ -34,6 +35,21 @@ class IMeteoService(ABC):
             MetarReport: The newly added METAR report to the repository.
         """
 
+    @abstractmethod
+    async def add_text_reports(
+        self,
+        text_reports: Iterable[str],
+    ) -> MetarBulkDTO:
+        """A service method adding many text reports to the database.
+
+        Args:
+            text_reports (Iterable[str]): The METAR reports in text form.
+
+        Returns:
+            MetarBulkDTO: The newly added METAR reports and the indices of
+                the rejected ones.
+        """
+
     @abstractmethod
     async def get_all_reports(self) -> Iterable[MetarReport]:
         """A service method getting all METAR reports from the repository.
@@ -42,6 +58,14 @@ class IMeteoService(ABC):
             Iterable[MetarReport]: All METAR reports.
         """
 
+    @abstractmethod
+    def stream_all_json(self) -> AsyncIterator[str]:
+        """A service method streaming all METAR reports serialized to JSON.
+
+        Yields:
+            str: The JSON object of the next report.
+        """
+
     @abstractmethod
     async def get_by_airport(
         self,
@@ -74,11 +98,14 @@ class IMeteoService(ABC):
         """
 
     @abstractmethod
-    async def remove_report(self, report_id: int) -> None:
+    async def remove_report(self, report_id: int) -> bool:
         """A service method removing report by provided ID.
 
         Args:
             report_id (int): The ID of thr report.
+
+        Returns:
+            bool: Success of the operation.
         """
 
     @abstractmethod
@@ -1,13 +1,15 @@
 """A module containing implementation of METAR service."""
 
 
+import asyncio
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import AsyncIterator, Iterable, Optional
 
-import numpy as np
+from metar import Metar
 
-from src.core.domain.meteo import MetarReport, MetarReportIn
+from src.core.domain.meteo import METAR_RE, MetarReport, MetarReportIn
 from src.core.repositories.imeteo import IMeteoRepository
+from src.infrastructure.dto.metarbulkdto import MetarBulkDTO
 from src.infrastructure.dto.meteostats import MeteoStatsDTO
 from src.infrastructure.services.imeteo import IMeteoService
 
@@ -41,6 +43,10 @@ class MeteoService(IMeteoService):
     async def add_text_report(self, text_report: str) -> MetarReport:
         """A service method adding a new text report to the database.
 
+        Common reports are parsed inline on the regex path. Other ones go
+        through the much slower `Metar.Metar` parser, so they are parsed
+        in a worker thread to keep the event loop free.
+
         Args:
             text_report (str): The METAR report in text form.
 
@@ -48,7 +54,43 @@ class MeteoService(IMeteoService):
             MetarReport: The newly added METAR report to the repository.
         """
 
-        return await self._repository.add_text_report(text_report)
+        if METAR_RE.fullmatch(text_report):
+            report = MetarReportIn.from_text_report(text_report)
+        else:
+            report = await asyncio.to_thread(
+                MetarReportIn.from_text_report,
+                text_report,
+            )
+
+        return await self._repository.add_report(report)
+
+    async def add_text_reports(
+        self,
+        text_reports: Iterable[str],
+    ) -> MetarBulkDTO:
+        """A service method adding many text reports to the database.
+
+        The batch is parsed in a worker thread, so a large upload does not
+        block the event loop. Unparsable reports are skipped, so they do
+        not drop the rest of the batch.
+
+        Args:
+            text_reports (Iterable[str]): The METAR reports in text form.
+
+        Returns:
+            MetarBulkDTO: The newly added METAR reports and the indices of
+                the rejected ones.
+        """
+
+        reports, rejected = await asyncio.to_thread(
+            _parse_reports,
+            list(text_reports),
+        )
+
+        return MetarBulkDTO(
+            reports=await self._repository.add_reports(reports),
+            rejected=rejected,
+        )
 
     async def get_all_reports(self) -> Iterable[MetarReport]:
         """A service method getting all METAR reports from the repository.
@@ -59,6 +101,15 @@ class MeteoService(IMeteoService):
 
         return await self._repository.get_all_reports()
 
+    def stream_all_json(self) -> AsyncIterator[str]:
+        """A service method streaming all METAR reports serialized to JSON.
+
+        Yields:
+            str: The JSON object of the next report.
+        """
+
+        return self._repository.iterate_all_reports_json()
+
     async def get_by_airport(
         self,
         icao_code: str,
@@ -96,14 +147,17 @@ class MeteoService(IMeteoService):
 
         return await self._repository.get_by_id(report_id)
 
-    async def remove_report(self, report_id: int) -> None:
+    async def remove_report(self, report_id: int) -> bool:
         """A service method removing report by provided ID.
 
         Args:
             report_id (int): The ID of thr report.
+
+        Returns:
+            bool: Success of the operation.
         """
 
-        await self._repository.remove_report(report_id)
+        return await self._repository.remove_report(report_id)
 
     async def get_stats(
         self,
@@ -113,6 +167,9 @@ class MeteoService(IMeteoService):
     ) -> MeteoStatsDTO:
         """The service method returning meteo stats from provided period.
 
+        A missing period bound is replaced with the time of the first or
+        the last aggregated report.
+
         Args:
             icao_code (str): The ICAO code of the airport.
             start_date (datetime, optional): Start date of the stats.
@@ -122,45 +179,38 @@ class MeteoService(IMeteoService):
             MeteoStatsDTO: The basic meteo stats.
         """
 
-        # TODO: split into smaller methods
-        reports = await self._repository.get_by_airport(
+        stats = await self._repository.get_stats(
             icao_code=icao_code,
             start_date=start_date,
             end_date=end_date,
         )
 
-        temperatures, wind_speeds, rvrs, dew_points, qnhs = [], [], [], [], []
-
-        for report in reports:
-            temperatures.append(report.temp)
-            wind_speeds.append(report.wind_speed)
-            rvrs.append(report.rvr)
-            dew_points.append(report.dew_point)
-            qnhs.append(report.qnh)
-
-        temperatures_arr = np.array(temperatures)
-        wind_speeds_arr = np.array(wind_speeds)
-        rvrs_arr = np.array(rvrs)
-        dew_points_arr = np.array(dew_points)
-        qnhs_arr = np.array(qnhs)
-
         return MeteoStatsDTO(
-            start_time=start_date,
-            end_time=end_date,
+            start_time=start_date or stats["first_time"],
+            end_time=end_date or stats["last_time"],
             icao_code=icao_code,
-            avg_temperature=temperatures_arr.mean(),
-            min_temperature=temperatures_arr.min(),
-            max_temperature=temperatures_arr.max(),
-            avg_wind_speed=wind_speeds_arr.mean(),
-            min_wind_speed=wind_speeds_arr.min(),
-            max_wind_speed=wind_speeds_arr.max(),
-            avg_rvr=rvrs_arr.mean(),
-            min_rvr=rvrs_arr.min(),
-            max_rvr=rvrs_arr.max(),
-            avg_dew_point=dew_points_arr.mean(),
-            min_dew_point=dew_points_arr.min(),
-            max_dew_point=dew_points_arr.max(),
-            avg_qhn=qnhs_arr.mean(),
-            min_qhn=qnhs_arr.min(),
-            max_qhn=qnhs_arr.max(),
+            **stats,
         )
+
+
+def _parse_reports(
+    text_reports: list[str],
+) -> tuple[list[MetarReportIn], list[int]]:
+    """Function parsing a batch of text METAR reports.
+
+    Args:
+        text_reports (list[str]): The METAR reports in text form.
+
+    Returns:
+        tuple[list[MetarReportIn], list[int]]: The parsed METAR reports
+            and the indices of the reports which could not be parsed.
+    """
+
+    reports, rejected = [], []
+    for index, text_report in enumerate(text_reports):
+        try:
+            reports.append(MetarReportIn.from_text_report(text_report))
+        except (Metar.ParserError, ValueError):
+            rejected.append(index)
+
+    return reports, rejected
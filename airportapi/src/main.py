@@ -3,25 +3,24 @@
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
-from fastapi import FastAPI, HTTPException, Request, Response
-from fastapi.exception_handlers import http_exception_handler
+from asyncpg.exceptions import UniqueViolationError  # type: ignore
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 
+from src.api import routers
 from src.api.routers.airport import router as airport_router
 from src.api.routers.continent import router as continent_router
 from src.api.routers.country import router as country_router
 from src.api.routers.meteo import router as meteo_router
 from src.api.routers.user import router as user_router
+from src.api.utils.etag import ETagMiddleware
+from src.cache import init_cache
 from src.container import Container
 from src.db import database, init_db
 
 container = Container()
-container.wire(modules=[
-    "src.api.routers.continent",
-    "src.api.routers.country",
-    "src.api.routers.airport",
-    "src.api.routers.meteo",
-    "src.api.routers.user",
-])
+container.wire(packages=[routers])
 
 
 @asynccontextmanager
@@ -29,11 +28,14 @@ async def lifespan(_: FastAPI) -> AsyncGenerator:
     """Lifespan function working on app startup."""
     await init_db()
     await database.connect()
+    init_cache()
     yield
     await database.disconnect()
 
 
-app = FastAPI(lifespan=lifespan)
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
+app.add_middleware(ETagMiddleware)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 app.include_router(airport_router, prefix="/airport")
 app.include_router(continent_router, prefix="/continent")
 app.include_router(country_router, prefix="/country")
@@ -41,18 +43,21 @@ app.include_router(meteo_router, prefix="/meteo")
 app.include_router(user_router, prefix="")
 
 
-@app.exception_handler(HTTPException)
-async def http_exception_handle_logging(
-    request: Request,
-    exception: HTTPException,
+@app.exception_handler(UniqueViolationError)
+async def unique_violation_handler(
+    _: Request,
+    exception: UniqueViolationError,
 ) -> Response:
-    """A function handling http exceptions for logging purposes.
+    """A function handling violations of the unique DB constraints.
 
     Args:
-        request (Request): The incoming HTTP request.
-        exception (HTTPException): A related exception.
+        _ (Request): The incoming HTTP request.
+        exception (UniqueViolationError): A related exception.
 
     Returns:
         Response: The HTTP response.
     """
-    return await http_exception_handler(request, exception)
+    return JSONResponse(
+        status_code=409,
+        content={"detail": exception.detail or "Resource already exists"},
+    )
@@ -2,108 +2,356 @@
 
 
 import asyncio
+import logging
 import os
+import queue
+import re
+import time
+from logging.handlers import QueueHandler, QueueListener
+from datetime import datetime, timezone
 
-import aiohttp
+import httpx
+import orjson
+import uvloop
 
 API_HOST = os.getenv("API_HOST", "app")
 API_PORT = os.getenv("API_PORT", "8000")
-METAR_ENDPOINT = (
+METAR_CYCLE_ENDPOINT = (
     "https://tgftp.nws.noaa.gov/data/observations"
-    "/metar/stations/{icao_code}.TXT"
+    "/metar/cycles/{hour:02d}Z.TXT"
+)
+# The parsed URL of every hourly cycle file, built once.
+METAR_CYCLE_URLS = [
+    httpx.URL(METAR_CYCLE_ENDPOINT.format(hour=hour)) for hour in range(24)
+]
+ALL_AIRPORTS_ENDPOINT = (
+    f"http://{API_HOST}:{API_PORT}/airport/all?has_icao=true"
 )
-ALL_AIRPORTS_ENDPOINT = f"http://{API_HOST}:{API_PORT}/airport/all"
 SEND_REPORT_ENDPOINT = f"http://{API_HOST}:{API_PORT}/meteo/create"
+SEND_REPORTS_ENDPOINT = f"http://{API_HOST}:{API_PORT}/meteo/bulk"
+USER_AGENT = "airport-meteo-scanner/1.0"
+JSON_HEADERS = {"Content-Type": "application/json"}
+HTTP_TIMEOUT = httpx.Timeout(10.0, connect=3.0, read=5.0)
+METAR_BATCH_SIZE = int(os.getenv("METAR_BATCH_SIZE", "200"))
+METAR_POSTERS = int(os.getenv("METAR_POSTERS", "8"))
+METAR_INTERVAL = float(os.getenv("METAR_INTERVAL", "3600"))
+AIRPORTS_TTL = float(os.getenv("AIRPORTS_TTL", "86400"))
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
+
+logger = logging.getLogger(__name__)
+
+STATION_RE = re.compile(r"[A-Z][A-Z0-9]{3} ")
+
+# The airports list with its ETag and the time it has to be revalidated.
+_AIRPORTS_CACHE: dict = {"expiry": 0.0, "etag": None, "airports": None}
+
+# UTC hour -> (ETag, Last-Modified, METARs by ICAO) of the last fetched cycle.
+_CYCLE_CACHE: dict[int, tuple[str | None, str | None, dict[str, str]]] = {}
 
+# ICAO code -> the last uploaded METAR report.
+_POSTED_METARS: dict[str, str] = {}
 
-async def fetch_airports(session: aiohttp.ClientSession) -> dict:
+
+async def fetch_airports(client: httpx.AsyncClient) -> list[dict]:
     """A coroutine fetching airport data.
 
+    The airports are kept for `AIRPORTS_TTL` seconds and then
+    revalidated with their ETag, so an unchanged list is not sent again.
+    The ICAO codes are uppercased once here, as NOAA lists them.
+
     Args:
-        session (aiohttp.ClientSession): The HTTP session.
+        client (httpx.AsyncClient): The HTTP client.
 
     Returns:
-        dict: The airport details.
+        list[dict]: The airport details.
     """
 
-    async with session.get(ALL_AIRPORTS_ENDPOINT) as response:
+    now = time.monotonic()
+    if _AIRPORTS_CACHE["airports"] is not None \
+            and now < _AIRPORTS_CACHE["expiry"]:
+        return _AIRPORTS_CACHE["airports"]
+
+    headers = {}
+    if _AIRPORTS_CACHE["etag"]:
+        headers["If-None-Match"] = _AIRPORTS_CACHE["etag"]
+
+    response = await client.get(ALL_AIRPORTS_ENDPOINT, headers=headers)
+    if response.status_code != 304:
         response.raise_for_status()
-        return await response.json()
+        airports = orjson.loads(response.content)
+        for airport in airports:
+            airport["icao_code"] = airport["icao_code"].upper()
+        _AIRPORTS_CACHE["airports"] = airports
+        _AIRPORTS_CACHE["etag"] = response.headers.get("ETag")
+    _AIRPORTS_CACHE["expiry"] = now + AIRPORTS_TTL
 
+    return _AIRPORTS_CACHE["airports"]
 
-async def fetch_metar(
-        session: aiohttp.ClientSession,
-        icao_code: str,
-) -> str | None:
-    """A coroutine for fetching METAR report from external service.
+
+async def fetch_metar_cycle(
+        client: httpx.AsyncClient,
+        hour: int,
+) -> dict[str, str]:
+    """A coroutine fetching all METAR reports of an hourly NOAA cycle.
+
+    The request is conditional on the previously fetched cycle file, so
+    NOAA answers with a bodyless 304 when nothing has changed.
 
     Args:
-        session (aiohttp.ClientSession): The HTTP session.
-        icao_code (str): The airport's ICAO code.
+        client (httpx.AsyncClient): The HTTP client.
+        hour (int): The UTC hour of the cycle.
 
     Returns:
-        str | None: The METAR report if available.
+        dict[str, str]: The latest METAR report of every station.
     """
 
+    cached = _CYCLE_CACHE.get(hour)
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
     try:
-        async with session.get(
-            METAR_ENDPOINT.format(
-                icao_code=icao_code.upper(),
-            ),
-        ) as response:
-            response.raise_for_status()
-            text = await response.text()
-            return text.split("\n")[1]
-    except aiohttp.ClientResponseError:
-        print(f"Error while getting METAR data for {icao_code}")
-        return None
-
-
-async def post_metar(session: aiohttp.ClientSession, metar_data: str) -> None:
+        response = await client.get(
+            METAR_CYCLE_URLS[hour],
+            headers=headers,
+        )
+        if cached and response.status_code == 304:
+            return cached[2]
+
+        response.raise_for_status()
+    except httpx.HTTPError:
+        logger.warning("Error while getting METAR cycle %02dZ", hour)
+        return {}
+
+    # Reports are appended as they come, so the later ones win.
+    metars = {
+        line[:4]: line.rstrip()
+        for line in response.text.splitlines()
+        if STATION_RE.match(line)
+    }
+    _CYCLE_CACHE[hour] = (
+        response.headers.get("ETag"),
+        response.headers.get("Last-Modified"),
+        metars,
+    )
+
+    return metars
+
+
+async def post_metar(client: httpx.AsyncClient, metar_data: str) -> bool:
     """A coroutine uploading metar report.
 
     Args:
-        session (aiohttp.ClientSession): The HTTP session object.
+        client (httpx.AsyncClient): The HTTP client.
         metar_data (str): The METAR report.
+
+    Returns:
+        bool: Whether the report was stored by the API.
+    """
+
+    try:
+        response = await client.post(
+            SEND_REPORT_ENDPOINT,
+            content=orjson.dumps({"report": metar_data}),
+            headers=JSON_HEADERS,
+        )
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        logger.warning("Error while sending METAR: %s", e)
+        return False
+
+    return True
+
+
+async def post_metar_batch(
+        client: httpx.AsyncClient,
+        metar_batch: list[str],
+) -> list[str]:
+    """A coroutine uploading many metar reports at once.
+
+    Unparsable reports are skipped by the API and left out of the
+    result. If the API fails the whole batch, the reports are sent one
+    by one.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client.
+        metar_batch (list[str]): The METAR reports.
+
+    Returns:
+        list[str]: The reports stored by the API.
     """
 
     try:
-        async with session.post(
-            f"{SEND_REPORT_ENDPOINT}?report={metar_data}",
-        ) as response:
-            response.raise_for_status()
-    except aiohttp.ClientResponseError as e:
-        print(f"Error while sending METAR: {e}")
+        response = await client.post(
+            SEND_REPORTS_ENDPOINT,
+            content=orjson.dumps(metar_batch),
+            headers=JSON_HEADERS,
+        )
+        response.raise_for_status()
+        rejected = set(orjson.loads(response.content)["rejected"])
+        return [
+            metar_data for index, metar_data in enumerate(metar_batch)
+            if index not in rejected
+        ]
+    except httpx.HTTPError as e:
+        logger.warning("Error while sending METAR batch: %s", e)
 
+    return [
+        metar_data for metar_data in metar_batch
+        if await post_metar(client, metar_data)
+    ]
 
-async def process_airport(
-        session: aiohttp.ClientSession,
-        airport: dict,
+
+async def post_worker(
+        client: httpx.AsyncClient,
+        metars: asyncio.Queue,
+) -> None:
+    """A coroutine uploading the queued METAR reports in batches.
+
+    Only the reports stored by the API are remembered as uploaded, so
+    the failed ones are sent again in the next cycle.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client.
+        metars (asyncio.Queue): The (ICAO code, METAR report) pairs,
+            ended with `None`.
+    """
+
+    metar_batch: dict[str, str] = {}
+    while (item := await metars.get()) is not None:
+        icao_code, metar_data = item
+        metar_batch[icao_code] = metar_data
+        if len(metar_batch) >= METAR_BATCH_SIZE:
+            await _post_and_remember(client, metar_batch)
+            metar_batch = {}
+
+    if metar_batch:
+        await _post_and_remember(client, metar_batch)
+
+
+async def _post_and_remember(
+        client: httpx.AsyncClient,
+        metar_batch: dict[str, str],
 ) -> None:
-    """A coroutine processing airport data.
+    """A coroutine uploading a batch and recording the stored reports.
+
+    Args:
+        client (httpx.AsyncClient): The HTTP client.
+        metar_batch (dict[str, str]): The METAR reports by ICAO code.
+    """
+
+    uploaded = set(await post_metar_batch(client, list(metar_batch.values())))
+    for icao_code, metar_data in metar_batch.items():
+        if metar_data in uploaded:
+            _POSTED_METARS[icao_code] = metar_data
+
+
+async def cycle(client: httpx.AsyncClient) -> None:
+    """A coroutine fetching and uploading METAR reports of all airports.
+
+    The reports come from the previous and the current hourly NOAA
+    cycle files instead of a request per station. Only the reports not
+    uploaded yet are sent, by `METAR_POSTERS` uploaders. The requests
+    run in task groups, so no task outlives the cycle. Failed cycle file
+    fetches and uploads are only logged. Any other error, e.g. of the
+    airports request, cancels the remaining tasks of its group and is
+    raised as an exception group.
 
     Args:
-        session (aiohttp.ClientSession): The HTTP session object.
-        airport (dict): The airport data.
+        client (httpx.AsyncClient): The HTTP client.
+    """
+
+    hour = datetime.now(timezone.utc).hour
+    async with asyncio.TaskGroup() as group:
+        airports_task = group.create_task(fetch_airports(client))
+        cycle_tasks = [
+            group.create_task(fetch_metar_cycle(client, cycle_hour))
+            for cycle_hour in ((hour - 1) % 24, hour)
+        ]
+
+    metars = {}
+    for cycle_task in cycle_tasks:
+        metars.update(cycle_task.result())
+
+    metar_queue: asyncio.Queue[tuple[str, str] | None] = asyncio.Queue()
+    for airport in airports_task.result():
+        icao_code = airport["icao_code"]
+        metar_data = metars.get(icao_code)
+        if metar_data and _POSTED_METARS.get(icao_code) != metar_data:
+            metar_queue.put_nowait((icao_code, metar_data))
+    for _ in range(METAR_POSTERS):
+        metar_queue.put_nowait(None)
+
+    async with asyncio.TaskGroup() as group:
+        for _ in range(METAR_POSTERS):
+            group.create_task(post_worker(client, metar_queue))
+
+
+async def run_forever() -> None:
+    """The main coroutine processing data every `METAR_INTERVAL` seconds.
+
+    A single client is kept for all cycles, so its connection pool is
+    reused. Errors of a cycle are logged and the next cycle still runs.
     """
 
-    icao_code = airport["icao_code"]
-    if not icao_code:
-        print(f"Missing ICAO for airport: {airport['name']}. Skipping...")
-        return
+    limits = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=50,
+        keepalive_expiry=75,
+    )
+    async with httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": USER_AGENT},
+        limits=limits,
+        timeout=HTTP_TIMEOUT,
+    ) as client:
+        while True:
+            started = time.monotonic()
+            try:
+                await cycle(client)
+            except* httpx.HTTPError as errors:
+                for e in errors.exceptions:
+                    logger.error("Error while processing airports: %s", e)
+            except* Exception as errors:
+                for e in errors.exceptions:
+                    logger.error(
+                        "Unexpected error while processing airports",
+                        exc_info=e,
+                    )
+
+            elapsed = time.monotonic() - started
+            await asyncio.sleep(max(METAR_INTERVAL - elapsed, 0))
+
+
+def configure_logging() -> QueueListener:
+    """Function routing the log records through a queue.
 
-    metar_data = await fetch_metar(session, icao_code)
-    if metar_data:
-        await post_metar(session, metar_data)
+    The records are formatted in place and written to stderr by the
+    listener's thread, so logging never blocks the event loop.
 
+    Returns:
+        QueueListener: The started listener writing the records.
+    """
 
-async def main() -> None:
-    """The main coroutine processing data"""
-    async with aiohttp.ClientSession() as session:
-        airports = await fetch_airports(session)
-        tasks = [process_airport(session, airport) for airport in airports]
-        await asyncio.gather(*tasks)
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    logging.basicConfig(
+        format="%(asctime)s %(levelname)s %(message)s",
+        level=LOG_LEVEL,
+        handlers=[QueueHandler(log_queue)],
+    )
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+
+    return listener
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    log_listener = configure_logging()
+    try:
+        uvloop.run(run_forever())
+    finally:
+        log_listener.stop()